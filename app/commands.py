@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+"""Maintenance commands, run with `flask --app wsgi <command>`"""
+import click
+
+from app.services.attendance_service import AttendanceService
+from app.services.engagement_service import EngagementService
+from app.services.finance_service import FinanceService
+
+
+@click.command('rebuild-finance-summary')
+def rebuild_finance_summary():
+    """Recomputes the monthly finance summaries from the financial records"""
+    rows = FinanceService.rebuild_summary()
+    click.echo(f"Rebuilt {rows} financial summary rows")
+
+
+@click.command('rebuild-attendance-summary')
+def rebuild_attendance_summary():
+    """Recomputes the per-event attendance rollups from the attendance records"""
+    rows = AttendanceService.rebuild_summary()
+    click.echo(f"Rebuilt {rows} event attendance summary rows")
+
+
+@click.command('backfill-member-attendance')
+def backfill_member_attendance():
+    """Recomputes every member's last_attended_at and attendance_count from the attendance records"""
+    rows = AttendanceService.backfill_members()
+    click.echo(f"Backfilled {rows} members")
+
+
+@click.command('compute-engagement-scores')
+@click.option('--as-of', type=click.DateTime(formats=['%Y-%m-%d']), default=None,
+              help='Day the scores are computed for (defaults to today)')
+def compute_engagement_scores(as_of):
+    """Recomputes every member's engagement score and rank"""
+    rows = EngagementService.compute(as_of.date() if as_of else None)
+    click.echo(f"Scored {rows} members")
+
+
+commands = [rebuild_finance_summary, rebuild_attendance_summary, backfill_member_attendance,
+            compute_engagement_scores]
@@ -1,6 +1,22 @@
 #!/usr/bin/python3
 """Creates a Unique FileStorage instance for the application"""
+from config import Config
 from app.schemas.db_storage import DBStorage
+from app.models.attendance import Attendance
+from app.models.member import Member
+from app.models.user import User
+from app.schemas.shared_cache import SharedCache
+from app.schemas.unique_index import UniqueIndex
 
 storage = DBStorage()
 storage.reload()
+
+# Cache shared between workers; committed writes invalidate dependent entries
+cache = SharedCache.from_config(Config)
+cache.track(Attendance, 'date')  # date-range results depend on the days they cover
+storage.add_write_listener(cache.invalidate_writes)
+
+# Pre-check for duplicate usernames/emails, updated as inserts commit
+unique_index = UniqueIndex(storage, {User: ('username', 'email'), Member: ('email',)},
+                           Config.UNIQUE_INDEX_CAPACITY, Config.UNIQUE_INDEX_ERROR_RATE)
+storage.add_write_listener(unique_index.apply)
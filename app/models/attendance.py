@@ -2,7 +2,7 @@
 """"Tracks attendance and attendance records for church events"""
 from datetime import datetime
 
-from sqlalchemy import Column, String, ForeignKey, Text, Date, Boolean
+from sqlalchemy import Column, String, ForeignKey, Text, Date, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base_model import BaseModel, Base
@@ -11,6 +11,12 @@ from app.models.base_model import BaseModel, Base
 class Attendance(BaseModel, Base):
     """Tracks attendance for church events"""
     __tablename__ = 'attendance'
+    __table_args__ = (
+        Index('ix_attendance_event_id_date', 'event_id', 'date'),
+        Index('ix_attendance_member_id_date', 'member_id', 'date'),
+        Index('ix_attendance_date_status', 'date', 'status'),
+        Index('ix_attendance_created_at_id', 'created_at', 'id'),  # keyset pagination
+    )
 
     member_id = Column(String(60), ForeignKey('members.id'), nullable=True)
     event_id = Column(String(60), ForeignKey('events.id'), nullable=False)
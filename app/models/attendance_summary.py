@@ -0,0 +1,21 @@
+#!/usr/bin/python3
+"""Per-event attendance counts, maintained alongside the attendance records"""
+from sqlalchemy import Column, String, Integer, ForeignKey
+
+from app.models.base_model import BaseModel, Base
+
+
+class EventAttendanceSummary(BaseModel, Base):
+    """Turnout of one event: records by status, guests, and first-timers
+    (members whose earliest attendance record is for this event)"""
+    __tablename__ = 'event_attendance_summaries'
+
+    event_id = Column(String(60), ForeignKey('events.id'), nullable=False, unique=True)
+    total = Column(Integer, nullable=False, default=0)
+    present = Column(Integer, nullable=False, default=0)
+    absent = Column(Integer, nullable=False, default=0)
+    guests = Column(Integer, nullable=False, default=0)
+    first_timers = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<EventAttendanceSummary {self.event_id}, Total {self.total}>"
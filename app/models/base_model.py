@@ -4,8 +4,10 @@ import uuid
 from os import getenv
 
 from sqlalchemy import Column, String, DateTime
+from sqlalchemy.exc import NoInspectionAvailable
 
 from app import models
+from app.schemas.serializers import serializer_for
 from datetime import datetime
 
 from sqlalchemy.ext.declarative import declarative_base
@@ -55,10 +57,14 @@ class BaseModel:
         models.storage.save()
 
     def to_dict(self):
-        """Returns a dictionary containing all keys/values of __dict__"""
-        a_dict = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
-        a_dict['__class__'] = type(self).__name__
-        return a_dict
+        """Returns a JSON-ready dictionary of the mapped columns"""
+        try:
+            return serializer_for(type(self))(self)
+        except NoInspectionAvailable:
+            # Not a mapped class: fall back to the instance attributes
+            a_dict = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+            a_dict['__class__'] = type(self).__name__
+            return a_dict
 
     def delete(self):
         """Deletes the current instance from the storage"""
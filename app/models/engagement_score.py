@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+"""Member engagement scores, recomputed in batch from attendance and memberships"""
+from sqlalchemy import Column, String, Integer, Float, Date, ForeignKey, Index
+
+from app.models.base_model import BaseModel, Base
+
+
+class MemberEngagementScore(BaseModel, Base):
+    """Engagement of one member as of a given day: recency of the last
+    attendance, attendance counts over rolling windows, group and
+    department memberships, the resulting score and its rank (1 is the
+    most engaged)"""
+    __tablename__ = 'member_engagement_scores'
+    __table_args__ = (
+        Index('ux_member_engagement_scores_rank', 'rank', unique=True),  # keyset pagination
+    )
+
+    member_id = Column(String(60), ForeignKey('members.id', ondelete='CASCADE'), nullable=False, unique=True)
+    as_of = Column(Date, nullable=False)
+    last_attended = Column(Date, nullable=True)
+    attended_4w = Column(Integer, nullable=False, default=0)
+    attended_13w = Column(Integer, nullable=False, default=0)
+    attended_52w = Column(Integer, nullable=False, default=0)
+    memberships = Column(Integer, nullable=False, default=0)
+    score = Column(Float, nullable=False, default=0)
+    rank = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<MemberEngagementScore {self.member_id}, Score {self.score}, Rank {self.rank}>"
@@ -5,7 +5,7 @@ TODO 2: Track attendance by linking attendees (members or guests).
 TODO 3: Categorize events by type (e.g., service, workshop).
 TODO 4: Send notifications to members about events.
 """
-from sqlalchemy import Column, String, Date, Time, Text, ForeignKey
+from sqlalchemy import Column, String, Date, Time, Text, ForeignKey, Index
 
 from app.models.base_model import BaseModel, Base
 from sqlalchemy.orm import relationship
@@ -14,6 +14,9 @@ from sqlalchemy.orm import relationship
 class Event(BaseModel, Base):
     """Tracks and organizes church events"""
     __tablename__ = 'events'
+    __table_args__ = (
+        Index('ix_events_category', 'category'),  # attendance trends per category
+    )
 
     name = Column(String(100), nullable=False)
     start_date = Column(Date, nullable=False)
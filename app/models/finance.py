@@ -3,13 +3,18 @@
 from datetime import datetime
 
 from app.models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, Float, ForeignKey, Text, Date
+from sqlalchemy import Column, String, Float, ForeignKey, Text, Date, Index
 from sqlalchemy.orm import relationship
 
 
 class FinancialRecord(BaseModel, Base):
     """Tracks and manages financial records and transactions"""
     __tablename__ = 'financial_records'
+    __table_args__ = (
+        Index('ix_financial_records_date_category_type', 'date', 'category', 'type'),
+        Index('ix_financial_records_department_id_date', 'department_id', 'date'),
+        Index('ix_financial_records_created_at_id', 'created_at', 'id'),  # keyset pagination
+    )
 
     type = Column(String(50), nullable=False) # Income or Expense
     amount = Column(Float, nullable=False, default=0.0)
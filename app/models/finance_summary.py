@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Monthly totals of financial records, maintained alongside the records"""
+from app.models.base_model import BaseModel, Base
+from sqlalchemy import Column, String, Float, Integer, Index
+
+
+class FinancialSummary(BaseModel, Base):
+    """Total and number of financial records per month, type, category,
+    department and group. Missing departments and groups are stored as ''
+    so every combination has exactly one row."""
+    __tablename__ = 'financial_summaries'
+    __table_args__ = (
+        Index('ux_financial_summaries_key', 'period', 'type', 'category', 'department_id', 'group_id',
+              unique=True),
+    )
+
+    period = Column(Integer, nullable=False)  # YYYYMM
+    type = Column(String(50), nullable=False)
+    category = Column(String(50), nullable=False)
+    department_id = Column(String(60), nullable=False, default='')
+    group_id = Column(String(60), nullable=False, default='')
+    total = Column(Float, nullable=False, default=0.0)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<FinancialSummary {self.period} {self.type} - {self.category}, Total {self.total}>"
@@ -3,13 +3,19 @@
 from app.models.association_tables import member_department, member_group
 from app.models.base_model import BaseModel, Base
 from datetime import datetime
-from sqlalchemy import Column, String, ForeignKey, DateTime, Date
+from sqlalchemy import Column, String, ForeignKey, DateTime, Date, Integer, Index
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import relationship
 
 
 class Member(BaseModel, Base):
     """Tracks and organizes church members"""
     __tablename__ = 'members'
+    __table_args__ = (
+        Index('ix_members_status_role', 'status', 'role'),
+        Index('ix_members_created_at_id', 'created_at', 'id'),  # keyset pagination
+        Index('ix_members_status_last_attended_at', 'status', 'last_attended_at'),  # lapsed members
+    )
 
     # Personal Information
     first_name = Column(String(50), nullable=False)
@@ -28,6 +34,10 @@ class Member(BaseModel, Base):
     department_id = Column(String(60), ForeignKey('departments.id'), nullable=True)
     group_id = Column(String(60), ForeignKey('groups.id'), nullable=True)
 
+    # Engagement, maintained by AttendanceService from the PRESENT records
+    last_attended_at = Column(Date, nullable=True)
+    attendance_count = Column(Integer, nullable=False, default=0)
+
     # Relationships
     user = relationship("User", back_populates="member")
     department = relationship("Department", secondary=member_department, back_populates="members")
@@ -52,12 +62,20 @@ class Member(BaseModel, Base):
 
     @staticmethod
     def check_duplicate_email(email):
-        """Checks duplicate email"""
-        from app.models import storage
+        """Checks duplicate email, querying only if the index may hold it"""
+        from app.models import storage, unique_index
+        if not unique_index.might_exist(Member, 'email', email):
+            return None
         return storage.query(Member).filter(Member.email == email).first()
 
     def save(self):
         """Custom save method to ensure no duplicates, then saves the member"""
-        if self.check_duplicate_email(self.email):
+        if self.check_duplicate_email(self.email) not in (None, self):
             raise ValueError("Email already exists")
-        super().save()
\ No newline at end of file
+        try:
+            super().save()
+        except IntegrityError:
+            # The unique constraint has the last word (e.g. a concurrent insert)
+            from app.models import storage
+            storage.rollback()
+            raise ValueError("Email already exists")
\ No newline at end of file
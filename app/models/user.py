@@ -7,6 +7,7 @@ from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel, Base
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy import Column, String, Boolean, ForeignKey
+from sqlalchemy.exc import IntegrityError
 
 
 class User(BaseModel, Base):
@@ -38,23 +39,33 @@ class User(BaseModel, Base):
 
     @staticmethod
     def check_duplicate_username(username):
-        """Checks duplicate usernames"""
-        from app.models import storage
+        """Checks duplicate usernames, querying only if the index may hold it"""
+        from app.models import storage, unique_index
+        if not unique_index.might_exist(User, 'username', username):
+            return None
         return storage.query(User).filter(User.username == username).first()
 
     @staticmethod
     def check_duplicate_email(email):
-        """Checks duplicate email"""
-        from app.models import storage
+        """Checks duplicate email, querying only if the index may hold it"""
+        from app.models import storage, unique_index
+        if not unique_index.might_exist(User, 'email', email):
+            return None
         return storage.query(User).filter(User.email == email).first()
 
     def save(self):
         """Custom save method to ensure no duplicates, then saves the user"""
-        if self.check_duplicate_username(self.username):
+        if self.check_duplicate_username(self.username) not in (None, self):
             raise ValueError("Username already exists")
-        if self.check_duplicate_email(self.email):
+        if self.check_duplicate_email(self.email) not in (None, self):
             raise ValueError("Email already exists")
-        super().save()
+        try:
+            super().save()
+        except IntegrityError:
+            # The unique constraints have the last word (e.g. a concurrent registration)
+            from app.models import storage
+            storage.rollback()
+            raise ValueError("Username or email already exists")
 
     def __repr__(self):
         return f"<User {self.username}, Role: {self.role}>"
@@ -4,11 +4,12 @@ from flask import jsonify, request, Blueprint
 from marshmallow import ValidationError
 
 from app.models.user import User
-from app.models import storage
+from app.models import storage, cache
 from flask_jwt_extended import jwt_required
 
 
 from app.services.auth_service import AuthService
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
 from app.schemas.auth_schema import RegisterSchema
 
@@ -20,12 +21,12 @@ admin_bp = Blueprint('resources', __name__)
 @role_required(['ADMIN'])
 def get_all_users():
     """Retrieves all users"""
-    users = storage.all(User)
-    all_users = [users[user].to_dict() for user in users]
-    for user in all_users:
-        del user['password']
-        del user['__class__']
-    return jsonify(all_users), 200
+    def serialize(user):
+        user_dict = user.to_dict()
+        del user_dict['__class__']
+        return user_dict
+
+    return paginate(User, serialize=serialize)
 
 # Admin-only: Create a new user
 @admin_bp.route('/users', methods=['POST'])
@@ -60,7 +61,6 @@ def get_user(user_id):
     user = storage.get(User, user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
-    del user.password
     return jsonify(user.to_dict()), 200
 
 # Admin & Pastor: Update a user
@@ -98,3 +98,25 @@ def delete_user(user_id):
     user.delete()
     return jsonify({}), 204
 
+# Admin-only: Connection pool statistics
+@admin_bp.route('/storage/stats', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN'])
+def get_storage_stats():
+    """Retrieves connection pool usage, checkout wait times and cache counters"""
+    stats = {"pool": storage.pool_stats(), "object_cache": storage.cache_stats(),
+             "shared_cache": cache.stats()}
+    if storage.has_replica:
+        stats["replica_pool"] = storage.pool_stats(replica=True)
+        stats["replica_healthy"] = storage.replica_healthy()
+    return jsonify(stats), 200
+
+# Admin-only: Row counts for dashboards
+@admin_bp.route('/storage/counts', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN'])
+def get_storage_counts():
+    """Retrieves the number of records per resource and of active members"""
+    counts = storage.counts()
+    counts['ActiveMember'] = storage.count('Member', status='active')
+    return jsonify(counts), 200
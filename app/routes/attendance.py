@@ -7,18 +7,39 @@ from flask_jwt_extended import jwt_required
 
 from app.models.event import Event
 from app.models.member import Member
+from app.services.attendance_service import AttendanceService
+from app.services.participation_report_service import ParticipationReportService
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
+from app.utils.stream_helper import stream_json, wants_stream
 
 attendance_bp = Blueprint('attendance', __name__)
 
+
+def date_range_response(data, *keys):
+    """Returns the records between data's start_date and end_date whose `keys`
+    columns equal data's values; streamed when `?stream=true` is given,
+    otherwise served through the date-range result cache"""
+    filters = {key: data[key] for key in keys}
+    try:
+        start, end = AttendanceService.parse_range(data.get('start_date'), data.get('end_date'))
+    except ValueError:
+        return jsonify({"error": "start_date and end_date must be formatted as YYYY-MM-DD"}), 400
+    if wants_stream():
+        return stream_json(AttendanceService.date_range_query(start, end, **filters))
+
+    attendance_records = AttendanceService.date_range(start, end, **filters)
+    if not attendance_records:
+        return jsonify({"error": "No attendance records found"}), 404
+    return jsonify(attendance_records), 200
+
 # Admin & Pastor: Get all attendance records
 @attendance_bp.route('/attendance', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR'])
 def get_all_attendance():
     """Retrieves all attendance records"""
-    attendance_records = storage.all(Attendance)
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return paginate(Attendance)
 
 # Admin & Pastor: Create a new attendance record
 @attendance_bp.route('/attendance', methods=['POST'])
@@ -28,11 +49,10 @@ def create_attendance():
     """Creates a new attendance record"""
     data = request.get_json()
 
-    event = storage.get(Event, data['event_id'])
+    event, member = storage.get_each((Event, data['event_id']), (Member, data['member_id']))
     if not event:
         return jsonify({"error": "Event not found"}), 404
 
-    member = storage.get(Member, data['member_id'])
     if not member:
         return jsonify({"error": "Member not found"}), 404
 
@@ -46,9 +66,67 @@ def create_attendance():
 
     # Create a new Attendance record
     attendance = Attendance(**data)
-    attendance.save()
+    AttendanceService.create_records([attendance])
     return jsonify(attendance.to_dict()), 201
 
+# Admin & Pastor: Check in many members (and guests) for an event at once
+@attendance_bp.route('/attendance/batch', methods=['POST'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def create_attendance_batch():
+    """Creates attendance records for a list of members and guests in one transaction"""
+    data = request.get_json()
+    member_ids = data.get('member_ids', [])
+    guests = data.get('guests', [])
+    status = data.get('status', 'PRESENT')
+    if not isinstance(member_ids, list) or not isinstance(guests, list):
+        return jsonify({"error": "member_ids and guests must be lists"}), 400
+    for index, member_id in enumerate(member_ids):
+        if not isinstance(member_id, str):
+            return jsonify({"error": f"member_ids[{index}] must be a string"}), 400
+    for index, guest in enumerate(guests):
+        if not isinstance(guest, dict):
+            return jsonify({"error": f"guests[{index}] must be an object"}), 400
+
+    # Validate attendance status
+    if status not in ['PRESENT', 'ABSENT']:
+        return jsonify({"error": "Invalid attendance status"}), 400
+
+    event = storage.get(Event, data.get('event_id'))
+    if not event:
+        return jsonify({"error": "Event not found"}), 404
+
+    # One query for the members, one for the ones already recorded
+    members = storage.get_many(Member, member_ids)
+    recorded = {member_id for (member_id,) in storage.query(Attendance.member_id).filter(
+        Attendance.event_id == event.id, Attendance.member_id.in_(members.keys()))} if members else set()
+
+    common = {'event_id': event.id, 'status': status}
+    if data.get('date'):
+        common['date'] = data['date']
+
+    results, records = [], []
+    for member_id in member_ids:
+        if member_id not in members:
+            results.append({"member_id": member_id, "result": "not_found"})
+        elif member_id in recorded:
+            results.append({"member_id": member_id, "result": "already_recorded"})
+        else:
+            recorded.add(member_id)
+            record = Attendance(member_id=member_id, **common)
+            records.append(record)
+            results.append({"member_id": member_id, "result": "created", "attendance": record})
+    for guest in guests:
+        record = Attendance(is_guest=True, remarks=guest.get('remarks'), **common)
+        records.append(record)
+        results.append({"member_id": None, "result": "created", "attendance": record})
+
+    AttendanceService.create_records(records)
+    for result in results:
+        if 'attendance' in result:
+            result['attendance_id'] = result.pop('attendance').id
+    return jsonify({"event_id": event.id, "created": len(records), "results": results}), 201
+
 # Admin & Pastor: View a single attendance record
 @attendance_bp.route('/attendance/<string:attendance_id>', methods=['GET'])
 @jwt_required()
@@ -72,10 +150,7 @@ def update_attendance(attendance_id):
         return jsonify({"error": "Attendance record not found"}), 404
 
     data = request.get_json()
-    for key, value in data.items():
-        setattr(attendance, key, value)
-
-    attendance.save()
+    AttendanceService.update_record(attendance, data)
     return jsonify(attendance.to_dict()), 200
 
 # Admin & Pastor: Delete an attendance record
@@ -88,7 +163,7 @@ def delete_attendance(attendance_id):
     if not attendance:
         return jsonify({"error": "Attendance record not found"}), 404
 
-    attendance.delete()
+    AttendanceService.delete_record(attendance)
     return jsonify({}), 204
 
 # Admin & Pastor: Get all attendance records for a specific event
@@ -97,19 +172,59 @@ def delete_attendance(attendance_id):
 @role_required(['ADMIN', 'PASTOR'])
 def get_attendance_by_event(event_id):
     """Retrieves all attendance records for a specific event"""
-    attendance_records = storage.query(Attendance).filter_by(event_id=event_id).all()
+    attendance_records = storage.query(Attendance, read_only=True).filter_by(event_id=event_id).all()
     if not attendance_records:
         return jsonify({"error": "No attendance records found"}), 404
 
     return jsonify([record.to_dict() for record in attendance_records]), 200
 
+# Admin & Pastor: Turnout counts of an event, from its rollup
+@attendance_bp.route('/events/<string:event_id>/attendance/summary', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_event_attendance_summary(event_id):
+    """Retrieves the present/absent/guest/first-timer counts of an event"""
+    summary = AttendanceService.summary(event_id)
+    if summary is None:
+        if not storage.get(Event, event_id):
+            return jsonify({"error": "Event not found"}), 404
+        summary = {"event_id": event_id, "total": 0, "present": 0, "absent": 0, "guests": 0, "first_timers": 0}
+    return jsonify(summary), 200
+
+# Admin & Pastor: Weekly or monthly attendance trends per event category
+@attendance_bp.route('/attendance/trends', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_attendance_trends():
+    """Retrieves attendance counts, moving averages and year-over-year changes"""
+    args = request.args
+    try:
+        trends = AttendanceService.trends(args.get('interval', 'week'), args.get('start_date'), args.get('end_date'),
+                                          args.get('category'), args.get('status', 'PRESENT'), args.get('window', 4))
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+    return jsonify(trends), 200
+
+# Admin & Pastor: Attendance participation by member demographics
+@attendance_bp.route('/attendance/demographics', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_attendance_demographics():
+    """Retrieves participation by gender, marital status, age band and member status"""
+    try:
+        report = ParticipationReportService.report(request.args.get('start_date'), request.args.get('end_date'),
+                                                   request.args.get('event_id'))
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+    return jsonify(report), 200
+
 # Admin & Pastor: Get all attendance records for a specific member
 @attendance_bp.route('/attendance/member/<string:member_id>', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR'])
 def get_attendance_by_member(member_id):
     """Retrieves all attendance records for a specific member"""
-    attendance_records = storage.query(Attendance).filter_by(member_id=member_id).all()
+    attendance_records = storage.query(Attendance, read_only=True).filter_by(member_id=member_id).all()
     if not attendance_records:
         return jsonify({"error": "No attendance records found"}), 404
 
@@ -122,11 +237,7 @@ def get_attendance_by_member(member_id):
 def get_attendance_by_date():
     """Retrieves all attendance records for a specific date range"""
     data = request.get_json()
-    attendance_records = storage.query(Attendance).filter(Attendance.date.between(data['start_date'], data['end_date'])).all()
-    if not attendance_records:
-        return jsonify({"error": "No attendance records found"}), 404
-
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return date_range_response(data)
 
 # Admin & Pastor: Get all attendance records for a specific date range and event
 @attendance_bp.route('/attendance/date/event', methods=['GET'])
@@ -135,12 +246,7 @@ def get_attendance_by_date():
 def get_attendance_by_date_and_event():
     """Retrieves all attendance records for a specific date range and event"""
     data = request.get_json()
-    attendance_records = storage.query(Attendance).filter(Attendance.date.between(data['start_date'], data['end_date']),
-                                                          Attendance.event_id == data['event_id']).all()
-    if not attendance_records:
-        return jsonify({"error": "No attendance records found"}), 404
-
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return date_range_response(data, 'event_id')
 
 # Admin & Pastor: Get all attendance records for a specific date range and member
 @attendance_bp.route('/attendance/date/member', methods=['GET'])
@@ -150,11 +256,7 @@ def get_attendance_by_date_and_member():
     """Retrieves all attendance records for a specific date range and member"""
     data = request.get_json()
 
-    attendance_records = storage.query(Attendance).filter(Attendance.date.between(data['start_date'], data['end_date']),
-                                                          Attendance.member_id == data['member_id']).all()
-    if not attendance_records:
-        return jsonify({"error": "No attendance records found"}), 404
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return date_range_response(data, 'member_id')
 
 # Admin & Pastor: Get all attendance records for a specific date range, event, and member
 @attendance_bp.route('/attendance/date/event/member', methods=['GET'])
@@ -164,12 +266,7 @@ def get_attendance_by_date_event_and_member():
     """Retrieves all attendance records for a specific date range, event, and member"""
     data = request.get_json()
 
-    attendance_records = storage.query(Attendance).filter(Attendance.date.between(data['start_date'], data['end_date']),
-                                                          Attendance.event_id == data['event_id'],
-                                                          Attendance.member_id == data['member_id']).all()
-    if not attendance_records:
-        return jsonify({"error": "No attendance records found"}), 404
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return date_range_response(data, 'event_id', 'member_id')
 
 # Admin & Pastor: Get all attendance records for a specific date range, event, and member with a specific status
 @attendance_bp.route('/attendance/date/event/member/status', methods=['GET'])
@@ -179,14 +276,6 @@ def get_attendance_by_date_event_and_member_with_status():
     """Retrieve all attendance records for a specific date range, event, and member with a specific status"""
     data = request.get_json()
 
-    attendance_records = storage.query(Attendance).filter(Attendance.date.between(data['start_date'], data['end_date']),
-                                                          Attendance.event_id == data['event_id'],
-                                                          Attendance.member_id == data['member_id'],
-                                                          Attendance.status == data['status']).all()
-
-    if not attendance_records:
-        return jsonify({"error": "No attendance records found"}), 404
-
-    return jsonify([record.to_dict() for record in attendance_records]), 200
+    return date_range_response(data, 'event_id', 'member_id', 'status')
 
 
@@ -62,5 +62,5 @@ def login():
 def protected():
     """Protected route that requires authentication"""
     current_user = get_jwt_identity()
-    return jsonify({'message': f'Hello, {current_user['role']}! This is a restricted resource.'}), 200
+    return jsonify({'message': f"Hello, {current_user['role']}! This is a restricted resource."}), 200
 
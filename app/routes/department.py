@@ -2,11 +2,13 @@
 """Defines RBAC for Department table"""
 from flask import jsonify, request, Blueprint
 from app.models.department import Department
-from app.models import storage
+from app.models import storage, cache
 from flask_jwt_extended import jwt_required
 
 from app.models.group import Group
 from app.models.member import Member
+from app.utils.conditional_helper import conditional_get
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
 
 department_bp = Blueprint('departments', __name__)
@@ -15,10 +17,10 @@ department_bp = Blueprint('departments', __name__)
 @department_bp.route('/departments', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR', 'MEMBER'])
+@conditional_get(Department)
 def get_all_departments():
     """Retrieves all departments"""
-    departments = storage.all(Department)
-    return jsonify([department.to_dict() for department in departments]), 200
+    return paginate(Department)
 
 # Admin & Pastor: Create a new department
 @department_bp.route('/departments', methods=['POST'])
@@ -37,10 +39,14 @@ def create_department():
 @role_required(['ADMIN', 'PASTOR', 'MEMBER'])
 def get_department(department_id):
     """Retrieves a single department"""
-    department = storage.get(Department, department_id)
+    def payload():
+        department = storage.get(Department, department_id)
+        return department.to_dict() if department else None
+
+    department = cache.get_or_set('department', {'id': department_id}, payload, depends_on=[f'Department:{department_id}'])
     if not department:
         return jsonify({"error": "Department not found"}), 404
-    return jsonify(department.to_dict()), 200
+    return jsonify(department), 200
 
 # Admin & Pastor: Update a department
 @department_bp.route('/departments/<string:department_id>', methods=['PUT'])
@@ -87,11 +93,10 @@ def get_department_members(department_id):
 @role_required(['ADMIN', 'PASTOR'])
 def add_member_to_department(department_id):
     """Adds a member to a department"""
-    department = storage.get(Department, department_id)
+    data = request.get_json()
+    department, member = storage.get_each((Department, department_id), (Member, data['member_id']))
     if not department:
         return jsonify({"error": "Department not found"}), 404
-    data = request.get_json()
-    member = storage.get(Member, data['member_id'])
     if not member:
         return jsonify({"error": "Member not found"}), 404
     department.members.append(member)
@@ -104,10 +109,9 @@ def add_member_to_department(department_id):
 @role_required(['ADMIN', 'PASTOR'])
 def remove_member_from_department(department_id, member_id):
     """Removes a member from a department"""
-    department = storage.get(Department, department_id)
+    department, member = storage.get_each((Department, department_id), (Member, member_id))
     if not department:
         return jsonify({"error": "Department not found"}), 404
-    member = storage.get(Member, member_id)
     if not member:
         return jsonify({"error": "Member not found"}), 404
     department.members.delete(member)
@@ -120,12 +124,10 @@ def remove_member_from_department(department_id, member_id):
 @role_required(['ADMIN'])
 def register_group_for_department(department_id):
     """Registers a group for a department"""
-    department = storage.get(Department , department_id)
+    data = request.get_json()
+    department, group = storage.get_each((Department, department_id), (Group, data['group_id']))
     if not department:
         return jsonify({"error": "Department not found"}), 404
-
-    data = request.get_json()
-    group = storage.get(Group, data['group_id'])
     if not group:
         return jsonify({"error": "Group not found"}), 404
     department.group.append(group)
@@ -138,11 +140,9 @@ def register_group_for_department(department_id):
 @role_required(['ADMIN'])
 def unregister_group_from_department(department_id, group_id):
     """Unregisters a group from a department"""
-    department = storage.get(Department, department_id)
+    department, group = storage.get_each((Department, department_id), (Group, group_id))
     if not department:
         return jsonify({"error": "Department not found"}), 404
-
-    group = storage.get(Group, group_id)
     if not group:
         return jsonify({"error": "Group not found"}), 404
     department.group.delete(group)
@@ -166,10 +166,9 @@ def get_department_groups(department_id):
 @role_required(['ADMIN', 'PASTOR'])
 def get_department_group_members(department_id, group_id):
     """Retrieves all members in a group in a department"""
-    department = storage.get(Department, department_id)
+    department, group = storage.get_each((Department, department_id), (Group, group_id))
     if not department:
         return jsonify({"error": "Department not found"}), 404
-    group = storage.get(Group, group_id)
     if not group:
         return jsonify({"error": "Group not found"}), 404
 
@@ -181,14 +180,14 @@ def get_department_group_members(department_id, group_id):
 @role_required(['ADMIN', 'PASTOR'])
 def add_member_to_group_in_department(department_id, group_id):
     """Adds a member to a group in a department"""
-    department = storage.get(Department, department_id)
+    data = request.get_json()
+    department, group, member = storage.get_each(
+        (Department, department_id), (Group, group_id), (Member, data['member_id'])
+    )
     if not department:
         return jsonify({"error": "Department not found"}), 404
-    group = storage.get(Group, group_id)
     if not group:
         return jsonify({"error": "Group not found"}), 404
-    data = request.get_json()
-    member = storage.get(Member, data['member_id'])
     if not member:
         return jsonify({"error": "Member not found"}), 404
     group.members.append(member)
@@ -203,14 +202,13 @@ def add_member_to_group_in_department(department_id, group_id):
 @role_required(['ADMIN', 'PASTOR'])
 def remove_member_from_group_in_department(department_id, group_id, member_id):
     """Removes a member from a group in a department"""
-    department = storage.get(Department, department_id)
+    department, group, member = storage.get_each(
+        (Department, department_id), (Group, group_id), (Member, member_id)
+    )
     if not department:
         return jsonify({"error": "Department not found"}), 404
-
-    group = storage.get(Group, group_id)
     if not group:
         return jsonify({"error": "Group not found"}), 404
-    member = storage.get(Member, member_id)
     if not member:
         return jsonify({"error": "Member not found"}), 404
     group.members.delete(member)
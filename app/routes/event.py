@@ -2,8 +2,10 @@
 """Defines routes for managing events and BRAC for events based on user roles"""
 from flask import jsonify, request, Blueprint
 from app.models.event import Event
-from app.models import storage
+from app.models import storage, cache
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.utils.conditional_helper import conditional_get
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
 
 events_bp = Blueprint('events', __name__)
@@ -22,20 +24,23 @@ def create_event():
 @events_bp.route('/events', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR', 'MEMBER'])
+@conditional_get(Event)
 def get_all_events():
-    events = storage.all(Event)
-    return jsonify([event.to_dict() for event in events]), 200
+    return paginate(Event)
 
 # All roles: View a single event
 @events_bp.route('/events/<string:event_id>', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR', 'MEMBER'])
 def get_event(event_id):
-    event = storage.get(Event, event_id)
+    def payload():
+        event = storage.get(Event, event_id)
+        return event.to_dict() if event else None
+
+    event = cache.get_or_set('event', {'id': event_id}, payload, depends_on=[f'Event:{event_id}'])
     if not event:
         return jsonify({"error": "Event not found"}), 404
-
-    return jsonify(event.to_dict()), 200
+    return jsonify(event), 200
 
 # Admin & Pastor: Update an event
 @events_bp.route('/events/<string:event_id>', methods=['PUT'])
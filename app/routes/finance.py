@@ -3,8 +3,12 @@
 from flask import jsonify, request, Blueprint
 from app.models.finance import FinancialRecord
 from app.models import storage
+from app.services.finance_report_service import FinanceReportService
+from app.services.finance_service import FinanceService, SUMMARY_DIMENSIONS
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
+from app.utils.stream_helper import stream_json
 
 finance_bp = Blueprint('finance', __name__)
 
@@ -14,8 +18,10 @@ finance_bp = Blueprint('finance', __name__)
 @role_required(['ADMIN'])
 def create_financial_record():
     data = request.get_json()
-    record = FinancialRecord(**data)
-    record.save()
+    try:
+        record = FinanceService.create_record(data)
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
     return jsonify(record.to_dict()), 201
 
 # Admin & Pastor: View all financial records
@@ -23,8 +29,51 @@ def create_financial_record():
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR'])
 def get_all_financial_records():
-    records = storage.all(FinancialRecord)
-    return jsonify([record.to_dict() for record in records]), 200
+    return paginate(FinancialRecord)
+
+# Admin & Pastor: Export financial records as a streamed JSON array
+@finance_bp.route('/finance/export', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def export_financial_records():
+    query = storage.query(FinancialRecord, read_only=True)
+    start_date, end_date = request.args.get('start_date'), request.args.get('end_date')
+    if start_date:
+        query = query.filter(FinancialRecord.date >= start_date)
+    if end_date:
+        query = query.filter(FinancialRecord.date <= end_date)
+    for key in ['type', 'category', 'department_id', 'group_id', 'event_id']:
+        if request.args.get(key):
+            query = query.filter(getattr(FinancialRecord, key) == request.args[key])
+    return stream_json(query.order_by(FinancialRecord.date, FinancialRecord.id))
+
+# Admin & Pastor: Monthly totals from the summary table
+@finance_bp.route('/finance/summary', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_financial_summary():
+    group_by = request.args.get('group_by')
+    group_by = group_by.split(',') if group_by else None
+    if group_by and not set(group_by) <= set(SUMMARY_DIMENSIONS):
+        return jsonify({"error": f"group_by must be among {', '.join(SUMMARY_DIMENSIONS)}"}), 400
+    filters = {key: request.args[key] for key in SUMMARY_DIMENSIONS[1:] if request.args.get(key)}
+    try:
+        summary = FinanceService.summary(group_by, request.args.get('start'), request.args.get('end'), **filters)
+    except ValueError:
+        return jsonify({"error": "start and end must be formatted as YYYY-MM"}), 400
+    return jsonify(summary), 200
+
+# Admin & Pastor: Income-versus-expense statements by month, quarter or year
+@finance_bp.route('/finance/reports', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_financial_reports():
+    try:
+        report = FinanceReportService.report(request.args.get('period', 'month'), request.args.get('by'),
+                                             request.args.get('start_date'), request.args.get('end_date'))
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+    return jsonify(report), 200
 
 # Admin & Pastor: View a single financial record
 @finance_bp.route('/finance/<string:record_id>', methods=['GET'])
@@ -46,10 +95,10 @@ def update_financial_record(record_id):
         return jsonify({"error": "Financial record not found "}), 404
 
     data = request.get_json()
-    for key, value in data.items():
-        setattr(record, key, value)
-
-    record.save()
+    try:
+        FinanceService.update_record(record, data)
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
     return jsonify(record.to_dict()), 200
 
 # Admin & Pastor: Delete a financial record
@@ -60,6 +109,6 @@ def delete_financial_record(record_id):
     record = storage.get(FinancialRecord, record_id)
     if not record:
         return jsonify({"error": "Financial record not found"}), 404
-    record.delete()
+    FinanceService.delete_record(record)
     return jsonify({"message": "Financial record deleted successfully"}), 200
 
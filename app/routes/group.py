@@ -2,10 +2,12 @@
 """Defines RBAC for Groups table"""
 from flask import jsonify, request, Blueprint
 from app.models.group import Group
-from app.models import storage
+from app.models import storage, cache
 from flask_jwt_extended import jwt_required
 
 from app.models.member import Member
+from app.utils.conditional_helper import conditional_get
+from app.utils.pagination_helper import paginate
 from app.utils.role_helper import role_required
 
 group_bp = Blueprint('group', __name__)
@@ -14,10 +16,10 @@ group_bp = Blueprint('group', __name__)
 @group_bp.route('/groups', methods=['GET'])
 @jwt_required()
 @role_required(['ADMIN', 'PASTOR'])
+@conditional_get(Group)
 def get_all_groups():
     """Retrieves all groups"""
-    groups = storage.all(Group)
-    return jsonify([group.to_dict() for group in groups]), 200
+    return paginate(Group)
 
 # Admin: Create a new group
 @group_bp.route('/groups', methods=['POST'])
@@ -36,10 +38,14 @@ def create_group():
 @role_required(['ADMIN', 'PASTOR'])
 def get_group(group_id):
     """Retrieves a single group"""
-    group = storage.get(Group, group_id)
+    def payload():
+        group = storage.get(Group, group_id)
+        return group.to_dict() if group else None
+
+    group = cache.get_or_set('group', {'id': group_id}, payload, depends_on=[f'Group:{group_id}'])
     if not group:
         return jsonify({"error": "Group not found"}), 404
-    return jsonify(group.to_dict()), 200
+    return jsonify(group), 200
 
 # Admin & Pastor: Update a group
 @group_bp.route('/groups/<string:group_id>', methods=['PUT'])
@@ -76,10 +82,9 @@ def delete_group(group_id):
 @role_required(['ADMIN', 'PASTOR'])
 def add_member_to_group(group_id, member_id):
     """Adds a member to a group"""
-    group = storage.get(Group, group_id)
+    group, user = storage.get_each((Group, group_id), (Member, member_id))
     if not group:
         return jsonify({"error": "Group not found"}), 404
-    user = storage.get(Member, member_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
     group.members.append(user)
@@ -92,10 +97,9 @@ def add_member_to_group(group_id, member_id):
 @role_required(['ADMIN', 'PASTOR'])
 def remove_member_from_group(group_id, member_id):
     """Removes a member from a group"""
-    group = storage.get(Group, group_id)
+    group, user = storage.get_each((Group, group_id), (Member, member_id))
     if not group:
         return jsonify({"error": "Group not found"}), 404
-    user = storage.get(Member, member_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
     group.members.remove(user)
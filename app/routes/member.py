@@ -4,6 +4,9 @@ from flask import jsonify, request, Blueprint
 from app.models.member import Member
 from app.models import storage
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.attendance_service import AttendanceService
+from app.services.engagement_service import EngagementService
+from app.utils.pagination_helper import get_limit, link_next, paginate
 from app.utils.role_helper import role_required
 from marshmallow import ValidationError
 from app.schemas.member_schema import MemberSchema
@@ -16,8 +19,34 @@ members_bp = Blueprint('members', __name__)
 @role_required(['ADMIN', 'PASTOR'])
 def get_all_members():
     """Retrieves all members"""
-    members = storage.all(Member)
-    return jsonify([members[member].to_dict() for member in members]), 200
+    return paginate(Member)
+
+# Admin & Pastor: Members ranked by engagement score
+@members_bp.route('/members/engagement', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_member_engagement():
+    """Retrieves the members ranked by their last computed engagement score
+    (`order=bottom` lists those who need encouragement first)"""
+    try:
+        limit = get_limit()
+        rows, next_cursor = EngagementService.ranked(limit, request.args.get('cursor'),
+                                                     request.args.get('order', 'top'))
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+    return link_next(jsonify(rows), limit, next_cursor), 200
+
+# Admin & Pastor: Members who stopped attending
+@members_bp.route('/members/lapsed', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_lapsed_members():
+    """Retrieves the members who attended before but not in the last `weeks` weeks"""
+    try:
+        query = AttendanceService.lapsed_query(request.args.get('weeks', 4), request.args.get('status', 'active'))
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+    return paginate(Member, query)
 
 # Admin & Pastor: Create a new member
 @members_bp.route('/members', methods=['POST'])
@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+"""Defines RBAC for membership statistics"""
+from flask import jsonify, Blueprint
+from flask_jwt_extended import jwt_required
+
+from app.services.stats_service import StatsService
+from app.utils.role_helper import role_required
+
+stats_bp = Blueprint('stats', __name__)
+
+# Admin & Pastor: Member counts of every department and group
+@stats_bp.route('/stats/distribution', methods=['GET'])
+@jwt_required()
+@role_required(['ADMIN', 'PASTOR'])
+def get_distribution():
+    """Retrieves the active and inactive member counts of every department and group"""
+    return jsonify(StatsService.distribution()), 200
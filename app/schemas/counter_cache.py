@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Row counters for DBStorage.count kept current from committed writes"""
+import threading
+import time
+
+
+class CounterCache:
+    """Caches row counts per (class name, filters) and adjusts them on every
+    committed insert, update and delete instead of re-counting the table.
+    Counts are re-read from the database (reconciled) once they are older
+    than `ttl` seconds, which also absorbs writes made by other processes.
+    """
+
+    def __init__(self, ttl):
+        """Initializes an empty cache"""
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        self.__counts = {}  # (name, filters) -> [count, loaded_at, cls]
+
+    @staticmethod
+    def key(name, filters=None):
+        """Returns the cache key for a class name and equality filters"""
+        return name, frozenset((filters or {}).items())
+
+    def get(self, key):
+        """Returns the cached count, or None if missing or due for reconciliation"""
+        with self.__lock:
+            entry = self.__counts.get(key)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                return None
+            return entry[0]
+
+    def set(self, key, cls, count):
+        """Stores a count freshly read from the database"""
+        with self.__lock:
+            self.__counts[key] = [count, time.monotonic(), cls]
+
+    def clear(self):
+        """Forgets every count"""
+        with self.__lock:
+            self.__counts.clear()
+
+    def apply(self, writes):
+        """Adjusts the counts for the writes of one committed transaction"""
+        with self.__lock:
+            for (_, filters), entry in self.__counts.items():
+                cls = entry[2]
+                for operation, obj, previous in writes:
+                    if not isinstance(obj, cls):
+                        continue
+                    matches = self.__matches(obj, filters)
+                    if operation == 'new' and matches:
+                        entry[0] += 1
+                    elif operation == 'deleted' and self.__matches(obj, filters, previous):
+                        entry[0] -= 1
+                    elif operation == 'dirty':
+                        entry[0] += matches - self.__matches(obj, filters, previous)
+
+    @staticmethod
+    def __matches(obj, filters, previous=None):
+        """Checks the (previous) attribute values of obj against the filters"""
+        previous = previous or {}
+        return all(previous.get(k, getattr(obj, k, None)) == v for k, v in filters)
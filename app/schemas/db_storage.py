@@ -3,7 +3,14 @@
 databse connection
 """
 
+import base64
+import json
+import logging
 import os
+import threading
+import time
+from datetime import datetime
+
 from dotenv import load_dotenv
 from app.models.base_model import Base
 from app.models.user import User
@@ -11,110 +18,630 @@ from app.models.member import Member
 from app.models.event import Event
 from app.models.attendance import Attendance
 from app.models.finance import FinancialRecord
+from app.models.finance_summary import FinancialSummary  # noqa: F401  (summary table, not a resource)
+from app.models.attendance_summary import EventAttendanceSummary  # noqa: F401  (summary table, not a resource)
+from app.models.engagement_score import MemberEngagementScore  # noqa: F401  (score table, not a resource)
 from app.models.department import Department
 from app.models.group import Group
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from config import Config
+from app.schemas.counter_cache import CounterCache
+from app.schemas.object_cache import ObjectCache
+from app.schemas.pool_stats import TimedQueuePool
+from sqlalchemy import create_engine, event, func, inspect, literal, select, union_all, and_, or_
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker, scoped_session, aliased, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 classes = {
     'User': User, 'Member': Member, 'Event': Event,
     'FinanceRecord': FinancialRecord, 'Attendance': Attendance,
     'Department': Department, 'Group': Group
 }
 
+CURSOR_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def encode_cursor(created_at, id):
+    """Encodes a (created_at, id) keyset position as an opaque cursor"""
+    raw = json.dumps([created_at.strftime(CURSOR_TIME_FORMAT), id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decodes a cursor produced by encode_cursor into (created_at, id)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.strptime(created_at, CURSOR_TIME_FORMAT), id
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
 class DBStorage:
     """Manages storage of SQLAlchemy database"""
     __engine = None
     __session = None  # Session class instance
+    __replica_engine = None
+    __replica_session = None  # Session class instance for reads, if a replica is configured
+    __schema_created = False
 
-    def __init__(self):
-        """Creates the engine and session"""
-        user = os.getenv("FaithConnectHub_USER")
-        pwd = os.getenv("FaithConnectHub_PWD")
-        host = os.getenv("FaithConnectHub_HOST")
-        db = os.getenv("FaithConnectHub_DB")
-        self.__engine = create_engine(
-            f'mysql+mysqldb://{user}:{pwd}@{host}/{db}',
-            pool_pre_ping=True
-        )
+    def __init__(self, url=None, replica_url=None):
+        """Creates the engine and session, plus those of the read replica if any"""
+        self.__engine = self.create_engine(url or Config.SQLALCHEMY_DATABASE_URI)
+        self.__routing = threading.local()
+        replica_url = replica_url or Config.SQLALCHEMY_REPLICA_URI
+        if replica_url:
+            self.__replica_engine = self.create_engine(replica_url)
+            self.__replica_session = scoped_session(
+                sessionmaker(bind=self.__replica_engine, expire_on_commit=False, autoflush=False)
+            )
+            self.__replica_up = True
+            self.__replica_checked_at = time.monotonic()
+            event.listen(self.__replica_engine, 'handle_error', self.__replica_failed)
+        self.__write_listeners = []
+        self.__counter_cache = CounterCache(Config.COUNT_CACHE_TTL)
+        self.add_write_listener(self.__counter_cache.apply)
+        self.__object_cache = ObjectCache(Config.OBJECT_CACHE_SIZE, Config.OBJECT_CACHE_TTLS)
+        self.add_write_listener(self.__invalidate_written)
         if os.getenv("FaithConnectHub_ENV") == "test":
             Base.metadata.drop_all(self.__engine) # Drop all tables
 
+    @staticmethod
+    def create_engine(url):
+        """Creates an engine using the pool settings from Config"""
+        url = make_url(url)
+        options = {'pool_pre_ping': True}
+        if url.database not in [None, '', ':memory:']:
+            options.update(
+                poolclass=TimedQueuePool,
+                pool_size=Config.DB_POOL_SIZE,
+                max_overflow=Config.DB_MAX_OVERFLOW,
+                pool_recycle=Config.DB_POOL_RECYCLE,
+                pool_timeout=Config.DB_POOL_TIMEOUT
+            )
+        engine = create_engine(url, **options)
+
+        if Config.DB_STATEMENT_TIMEOUT and url.get_backend_name() == 'mysql':
+            @event.listens_for(engine, 'connect')
+            def set_statement_timeout(dbapi_connection, connection_record):
+                """Caps the execution time of SELECT statements on each new connection"""
+                cursor = dbapi_connection.cursor()
+                cursor.execute(f"SET SESSION MAX_EXECUTION_TIME = {int(Config.DB_STATEMENT_TIMEOUT)}")
+                cursor.close()
+        return engine
+
     def all(self, cls=None):
         """Returns a dictionary of all objects present"""
         dict_object = {}
-        if not self.__session:
-            self.reload()
+        session = self.reader()
         if type(cls) == str:
             cls = classes.get(cls, None)
         if cls:
-            for obj in self.__session.query(cls):
+            for obj in session.query(cls):
                 key = f"{type(obj).__name__}.{obj.id}"
                 dict_object[key] = obj
         else:
             for cls in classes.values():
-                for obj in self.__session.query(cls):
+                for obj in session.query(cls):
                     key = f"{type(obj).__name__}.{obj.id}"
                     dict_object[key] = obj
         return dict_object
 
+    @property
+    def engine(self):
+        """Returns the engine, shared with the Flask-SQLAlchemy extension"""
+        return self.__engine
+
+    @property
+    def has_replica(self):
+        """Returns whether a read replica is configured"""
+        return self.__replica_engine is not None
+
+    @property
+    def session(self):
+        """Returns the scoped_session registry, shared with the Flask-SQLAlchemy extension"""
+        if not self.__session:
+            self.reload()
+        return self.__session
+
     def reload(self):
-        """Reloads objects from the database"""
-        Base.metadata.create_all(self.__engine)
+        """Reloads objects from the database
+
+        The schema is created once per process and the session registry is
+        kept, so that everything holding a reference to it (e.g. db.session)
+        keeps working; only the current session is discarded.
+        """
+        if not self.__schema_created and Config.AUTO_CREATE_SCHEMA:
+            Base.metadata.create_all(self.__engine)
+            self.__schema_created = True
+        if self.__session:
+            self.__session.remove()
+            return
         session_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        event.listen(session_factory, 'after_flush', self.__collect_writes)
+        event.listen(session_factory, 'after_commit', self.__dispatch_writes)
+        event.listen(session_factory, 'after_rollback', self.__discard_writes)
         Session = scoped_session(session_factory)
         self.__session = Session
 
+    def pin_primary(self):
+        """Sends the reads of the current thread to the primary until close()
+
+        Used for requests that write, so that they read their own writes.
+        """
+        self.__routing.pinned = True
+
+    def reader(self):
+        """Returns the session reads should use
+
+        That is the read replica, unless none is configured, it is unhealthy
+        or the current thread is pinned to the primary.
+        """
+        if not self.__session:
+            self.reload()
+        if self.__replica_session is None or getattr(self.__routing, 'pinned', False):
+            return self.__session
+        if not self.replica_healthy():
+            return self.__session
+        return self.__replica_session
+
+    def replica_healthy(self):
+        """Returns whether the read replica is usable, probing it with
+        SELECT 1 at most every REPLICA_HEALTH_INTERVAL seconds"""
+        if self.__replica_engine is None:
+            return False
+        now = time.monotonic()
+        if now - self.__replica_checked_at >= Config.REPLICA_HEALTH_INTERVAL:
+            self.__replica_checked_at = now
+            try:
+                with self.__replica_engine.connect() as connection:
+                    connection.execute(select(1))
+                self.__replica_up = True
+            except SQLAlchemyError:
+                self.__replica_up = False
+        return self.__replica_up
+
+    def __replica_failed(self, context):
+        """Marks the replica down when a connection to it fails, so reads
+        fall back to the primary until the next health check"""
+        if context.is_disconnect or context.connection is None:
+            self.__replica_up = False
+            self.__replica_checked_at = time.monotonic()
+
+    def __adopt(self, obj):
+        """Detaches obj from the replica session so the primary can write it"""
+        if self.__replica_session is not None and obj in self.__replica_session:
+            self.__replica_session.expunge(obj)
+
+    def add_write_listener(self, listener):
+        """Registers listener(writes), called after every commit
+
+        `writes` lists the (operation, obj, previous) tuples of the committed
+        transaction, where operation is 'new', 'dirty' or 'deleted' and
+        previous holds the old values of the columns an update changed.
+        """
+        self.__write_listeners.append(listener)
+
+    @staticmethod
+    def __collect_writes(session, flush_context):
+        """Records the objects written by a flush until the transaction ends"""
+        writes = session.info.setdefault('writes', [])
+        writes.extend(('new', obj, {}) for obj in session.new)
+        for obj in session.dirty:
+            if not session.is_modified(obj):
+                continue
+            state = inspect(obj)
+            previous = {}
+            for attr in state.mapper.column_attrs:
+                history = state.attrs[attr.key].history
+                if history.deleted:
+                    previous[attr.key] = history.deleted[0]
+            writes.append(('dirty', obj, previous))
+        writes.extend(('deleted', obj, {}) for obj in session.deleted)
+
+    def __dispatch_writes(self, session):
+        """Hands the writes of a committed transaction to the listeners"""
+        writes = session.info.pop('writes', [])
+        if not writes:
+            return
+        for listener in self.__write_listeners:
+            try:
+                listener(writes)
+            except Exception:
+                # The data is already committed; a listener must not fail the request
+                logger.exception("Write listener %r failed", listener)
+
+    @staticmethod
+    def __discard_writes(session):
+        """Forgets the writes of a rolled back transaction"""
+        session.info.pop('writes', None)
+
     def new(self, obj):
         """Creates a new object"""
+        self.pin_primary()
+        self.__adopt(obj)
+        self.__object_cache.invalidate(type(obj), obj.id)
         self.__session.add(obj)
 
     def save(self):
         """saves the current session"""
         self.__session.commit()
 
+    def rollback(self):
+        """Rolls back the current session"""
+        self.__session.rollback()
+
+    def bulk_new(self, objs):
+        """Adds many new objects to the current session in one call"""
+        if not self.__session:
+            self.reload()
+        self.pin_primary()
+        now = datetime.now()
+        for obj in objs:
+            obj.updated_at = now
+        self.__session.add_all(objs)
+
+    def save_many(self, objs, batch_size=None):
+        """Inserts many new objects, committing every `batch_size` rows
+
+        Unique columns are checked set-wise (one IN query per column and
+        chunk, plus duplicates inside the batch itself) before inserting.
+        A failing row never aborts the batch: it is reported in `errors`
+        with its position in `objs`.
+        Returns {'saved': [ids], 'errors': [{'index', 'id', 'error'}]}
+        """
+        if not self.__session:
+            self.reload()
+        objs = list(objs)
+        batch_size = batch_size or Config.BULK_BATCH_SIZE
+        result = {'saved': [], 'errors': []}
+
+        for start in range(0, len(objs), batch_size):
+            rows = list(enumerate(objs[start:start + batch_size], start))
+            while rows:
+                # Rows repeating a value of an earlier row wait for that row
+                # to be inserted (or rejected), then are checked again
+                rows, deferred = self.__check_unique(rows, result['errors'])
+                self.__insert_rows(rows, result)
+                rows = deferred
+        return result
+
+    def __check_unique(self, rows, errors):
+        """Splits the rows into those whose unique columns clash neither
+        with the database nor with an earlier row, and those that repeat a
+        value of an earlier row; rows clashing with the database are
+        reported in errors. Returns (accepted, deferred)."""
+        by_cls = {}
+        for index, obj in rows:
+            by_cls.setdefault(type(obj), []).append((index, obj))
+
+        accepted, deferred = [], []
+        for cls, cls_rows in by_cls.items():
+            columns = [column for column in cls.__table__.columns if column.unique]
+            existing = {}
+            for column in columns:
+                values = {getattr(obj, column.key) for _, obj in cls_rows} - {None}
+                existing[column.key] = {
+                    value for (value,) in self.__session.query(column).filter(column.in_(values))
+                } if values else set()
+
+            taken = {column.key: set() for column in columns}  # values of the rows accepted so far
+            for index, obj in cls_rows:
+                values = {column.key: getattr(obj, column.key) for column in columns}
+                clash = next((key for key, value in values.items()
+                              if value is not None and value in existing[key]), None)
+                if clash:
+                    errors.append({'index': index, 'id': obj.id,
+                                   'error': f"{clash.capitalize()} already exists"})
+                elif any(value is not None and value in taken[key] for key, value in values.items()):
+                    deferred.append((index, obj))
+                else:
+                    for key, value in values.items():
+                        taken[key].add(value)
+                    accepted.append((index, obj))
+        return sorted(accepted, key=lambda row: row[0]), sorted(deferred, key=lambda row: row[0])
+
+    def __insert_rows(self, rows, result):
+        """Inserts the rows in one transaction, falling back to one
+        transaction per row to isolate failures if the batch is rejected"""
+        if not rows:
+            return
+        try:
+            self.bulk_new([obj for _, obj in rows])
+            self.__session.commit()
+            result['saved'].extend(obj.id for _, obj in rows)
+            return
+        except SQLAlchemyError:
+            self.__session.rollback()
+
+        for index, obj in rows:
+            try:
+                self.__session.add(obj)
+                self.__session.commit()
+                result['saved'].append(obj.id)
+            except SQLAlchemyError as err:
+                self.__session.rollback()
+                result['errors'].append({'index': index, 'id': obj.id,
+                                         'error': str(getattr(err, 'orig', None) or err)})
+
     def delete(self, obj=None):
         """Delets and object"""
         if not self.__session:
             self.reload()
         if obj:
+            self.pin_primary()
+            self.__adopt(obj)
+            self.__object_cache.invalidate(type(obj), obj.id)
             self.__session.delete(obj)
 
     def close(self):
-        """Closes the current session"""
-        self.__session.remove()
+        """Closes the current session and returns its connection to the pool"""
+        if self.__session:
+            self.__session.remove()
+        if self.__replica_session is not None:
+            self.__replica_session.remove()
+        self.__routing.pinned = False
+
+    def cache_stats(self):
+        """Returns the object cache hit/miss/eviction counters"""
+        return self.__object_cache.stats()
+
+    def preload(self, cls, *criteria):
+        """Loads the rows of a cacheable class matching the criteria into the
+        object cache; returns how many were cached"""
+        if not self.__object_cache.cacheable(cls):
+            return 0
+        objs = self.reader().query(cls).filter(*criteria).all()
+        for obj in objs:
+            self.__remember(obj)
+        return len(objs)
+
+    def __invalidate_written(self, writes):
+        """Drops cached snapshots of rows written by a committed transaction"""
+        for _, obj, _ in writes:
+            self.__object_cache.invalidate(type(obj), obj.id)
+
+    def __cached(self, session, cls, id):
+        """Returns the object from the session identity map or, failing
+        that, rebuilt from the object cache; None if neither has it"""
+        obj = session.identity_map.get(identity_key(cls, id))
+        if obj is not None or not self.__object_cache.cacheable(cls):
+            return obj
+        snapshot = self.__object_cache.get(cls, id)
+        if snapshot is None:
+            return None
+        obj = cls.__mapper__.class_manager.new_instance()
+        for key, value in snapshot.items():
+            set_committed_value(obj, key, value)
+        make_transient_to_detached(obj)
+        session.add(obj)
+        return obj
+
+    def __remember(self, obj):
+        """Puts a freshly loaded object in the object cache"""
+        cls = type(obj)
+        if not self.__object_cache.cacheable(cls):
+            return
+        state = inspect(obj)
+        snapshot = {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs
+                    if attr.key in state.dict}
+        if len(snapshot) == len(state.mapper.column_attrs):
+            self.__object_cache.put(cls, obj.id, snapshot)
+
+    def pool_stats(self, replica=False):
+        """Returns the pool status and checkout wait statistics"""
+        pool = (self.__replica_engine if replica else self.__engine).pool
+        stats = {'class': type(pool).__name__, 'status': pool.status()}
+        if isinstance(pool, TimedQueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                **pool.stats.to_dict()
+            )
+        return stats
 
     def get(self, cls, id):
-        """Returns an object based on the class name and id"""
-        if cls not in classes.values():
+        """Returns an object based on the class name and id
+
+        Uses a primary-key lookup, so objects already present in the
+        session identity map are returned without touching the database.
+        """
+        if type(cls) == str:
+            cls = classes.get(cls, None)
+        if cls not in classes.values() or id is None:
             return None
+        session = self.reader()
+        obj = self.__cached(session, cls, id)
+        if obj is None:
+            obj = session.get(cls, id)
+            if obj is not None:
+                self.__remember(obj)
+        return obj
 
-        all_cls = self.all(cls)
-        for value in all_cls.values():
-            if value.id == id:
-                return value
+    def get_many(self, cls, ids):
+        """Returns a dictionary of objects of one class keyed by id
 
-        return None
+        Ids already loaded in the session are served from the identity map,
+        the rest are fetched with a single IN query. Unknown ids are absent
+        from the result.
+        """
+        if type(cls) == str:
+            cls = classes.get(cls, None)
+        if cls not in classes.values():
+            return {}
+        session = self.reader()
 
-    def query(self, cls):
-        """Returns a query object"""
+        found = {}
+        missing = set()
+        for id in ids:
+            if id is None or id in found:
+                continue
+            obj = self.__cached(session, cls, id)
+            if obj is not None:
+                found[id] = obj
+            else:
+                missing.add(id)
+
+        if missing:
+            for obj in session.query(cls).filter(cls.id.in_(missing)):
+                found[obj.id] = obj
+                self.__remember(obj)
+        return found
+
+    def get_each(self, *lookups):
+        """Resolves several (cls, id) pairs, possibly of different classes,
+        in one round trip
+
+        Returns a list with the object (or None) for each pair, in order.
+        Every lookup is LEFT OUTER JOINed onto a single-row anchor so that a
+        missing object yields None without hiding the others.
+        """
+        session = self.reader()
+
+        results = [None] * len(lookups)
+        pending = []
+        for index, (cls, id) in enumerate(lookups):
+            if type(cls) == str:
+                cls = classes.get(cls, None)
+            if cls not in classes.values() or id is None:
+                continue
+            obj = self.__cached(session, cls, id)
+            if obj is not None:
+                results[index] = obj
+            else:
+                pending.append((index, cls, id))
+
+        if len(pending) == 1:
+            index, cls, id = pending[0]
+            results[index] = session.get(cls, id)
+        elif pending:
+            anchor = select(literal(1).label('anchor')).subquery()
+            entities = [aliased(cls) for _, cls, _ in pending]
+            query = session.query(*entities).select_from(anchor)
+            for entity, (_, _, id) in zip(entities, pending):
+                query = query.outerjoin(entity, entity.id == id)
+            row = query.first()
+            for (index, _, _), obj in zip(pending, row):
+                results[index] = obj
+        for index, _, _ in pending:
+            if results[index] is not None:
+                self.__remember(results[index])
+        return results
+
+    def page(self, cls, limit, cursor=None, query=None):
+        """Returns one keyset page of objects ordered by (created_at, id)
+
+        `cursor` is the opaque value returned as next_cursor by the previous
+        call, `query` optionally narrows the rows (it must select `cls`).
+        Returns a tuple (objects, next_cursor); next_cursor is None on the
+        last page.
+        """
+        if type(cls) == str:
+            cls = classes.get(cls, None)
+        if cls not in classes.values():
+            return [], None
+
+        if query is None:
+            query = self.reader().query(cls)
+        # Fetch the key columns alongside the entity so the cursor always
+        # carries the stored values, not unflushed in-memory ones
+        query = query.add_columns(cls.created_at, cls.id)
+        if cursor:
+            created_at, id = decode_cursor(cursor)
+            query = query.filter(or_(
+                cls.created_at > created_at,
+                and_(cls.created_at == created_at, cls.id > id)
+            ))
+        rows = query.order_by(cls.created_at, cls.id).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            _, created_at, id = rows[-1]
+            next_cursor = encode_cursor(created_at, id)
+        return [row[0] for row in rows], next_cursor
+
+    def query(self, cls, read_only=False):
+        """Returns a query object
+
+        Read-only queries may be served by the read replica; leave
+        read_only off for queries whose objects will be modified.
+        """
         if not self.__session:
             self.reload() # Ensure the session is initialized
+        if read_only:
+            return self.reader().query(cls)
         return self.__session.query(cls)
 
-    def count(self, cls=None):
-        """Returns the number of objects in storage"""
-        total = 0
-        if cls is not None and type(cls) is str and cls in classes:
-            cls = classes[cls]
-            total += self.__session.query(cls).count()
-        else:
-            for cls in classes.values():
-                total += self.__session.query(cls).count()
-        return total
+    def count(self, cls=None, **filters):
+        """Returns the number of objects in storage
+
+        With a class, counts its rows, optionally only those whose columns
+        equal the given filters (e.g. count(Member, status='active')).
+        Without a class, returns the total over every class.
+        """
+        if cls is None:
+            return sum(self.counts().values())
+        if type(cls) is not str:
+            cls = next((name for name, value in classes.items() if value is cls), None)
+        if cls not in classes:
+            return 0
+        return self.counts([cls], {cls: filters} if filters else None)[cls]
+
+    def counts(self, names=None, filters=None):
+        """Returns a dictionary of row counts keyed by class name
+
+        Counts come from the counter cache, which is adjusted on every
+        commit; the ones missing or due for reconciliation are fetched
+        together in a single UNION ALL query. They are read from the
+        primary, where those commits land: a lagging replica would miss
+        writes the deltas then add again once it caught up.
+        :param names: Class names to count (defaults to every class)
+        :param filters: Optional {class name: {column: value}} equality filters
+        """
+        names = [name for name in (names or classes) if name in classes]
+        filters = filters or {}
 
+        result, missing = {}, []
+        for name in names:
+            key = CounterCache.key(name, filters.get(name))
+            cached = self.__counter_cache.get(key)
+            if cached is None:
+                missing.append((name, key))
+            else:
+                result[name] = cached
 
+        if missing:
+            selects = []
+            for name, _ in missing:
+                cls = classes[name]
+                stmt = select(literal(name).label('name'), func.count().label('total')).select_from(cls)
+                for column, value in filters.get(name, {}).items():
+                    stmt = stmt.where(getattr(cls, column) == value)
+                selects.append(stmt)
+            stmt = selects[0] if len(selects) == 1 else union_all(*selects)
+            totals = dict(self.session.execute(stmt).all())
+            for name, key in missing:
+                result[name] = totals.get(name, 0)
+                self.__counter_cache.set(key, classes[name], result[name])
+        return result
 
+    def version(self, cls):
+        """Returns (latest updated_at, row count) of a class in one aggregate query
 
+        Together they change whenever a row is added, updated or deleted,
+        which makes them a cheap version of the whole collection.
+        """
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls is None:
+            return None, 0
+        stmt = select(func.max(cls.updated_at), func.count()).select_from(cls)
+        return tuple(self.reader().execute(stmt).one())
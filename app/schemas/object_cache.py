@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""In-process read-through cache of model rows for DBStorage"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ObjectCache:
+    """Bounded LRU cache of row snapshots keyed by (class name, id).
+
+    Only classes with a TTL in `ttls` are cached; entries expire after
+    their class TTL and the least recently used entry is evicted once
+    `max_size` is reached. Snapshots are plain {column: value} dicts, so
+    no ORM object is ever shared between sessions or threads.
+    """
+
+    def __init__(self, max_size, ttls):
+        """Initializes an empty cache"""
+        self.max_size = max_size
+        self.ttls = dict(ttls)
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()  # (class name, id) -> (snapshot, expires_at)
+        self.hits = self.misses = self.evictions = 0
+
+    def cacheable(self, cls):
+        """Returns whether objects of cls are cached"""
+        return self.max_size > 0 and cls.__name__ in self.ttls
+
+    def get(self, cls, id):
+        """Returns the snapshot of a row, or None on a miss"""
+        key = (cls.__name__, id)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, cls, id, snapshot):
+        """Stores the snapshot of a row, evicting the least recently used"""
+        key = (cls.__name__, id)
+        with self.__lock:
+            self.__entries[key] = (snapshot, time.monotonic() + self.ttls[cls.__name__])
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, cls, id):
+        """Drops the snapshot of a row"""
+        with self.__lock:
+            self.__entries.pop((cls.__name__, id), None)
+
+    def clear(self):
+        """Drops every snapshot"""
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self):
+        """Returns the size and hit/miss/eviction counters"""
+        with self.__lock:
+            return {
+                'size': len(self.__entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""Connection pool instrumentation for DBStorage"""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """Collects checkout wait times for a connection pool"""
+
+    def __init__(self):
+        """Initializes the counters"""
+        self.__lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait, timed_out=False):
+        """Records how long one checkout waited for a connection"""
+        with self.__lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def reset(self):
+        """Resets all counters"""
+        with self.__lock:
+            self.checkouts = self.timeouts = 0
+            self.total_wait = self.max_wait = 0.0
+
+    def to_dict(self):
+        """Returns the counters with wait times in milliseconds"""
+        with self.__lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'wait_avg_ms': round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                'wait_max_ms': round(self.max_wait * 1000, 3),
+                'wait_total_ms': round(self.total_wait * 1000, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that measures how long each checkout waits for a connection"""
+
+    def __init__(self, *args, stats=None, **kwargs):
+        """Initializes the pool with a (possibly shared) PoolStats"""
+        super().__init__(*args, **kwargs)
+        self.stats = stats or PoolStats()
+
+    def _do_get(self):
+        """Checks out a connection, timing the wait"""
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        """Recreates the pool, keeping the collected stats"""
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
@@ -0,0 +1,217 @@
+#!/usr/bin/python3
+"""Shared (cross-worker) cache for serialized payloads and computed reports"""
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from datetime import date, datetime, time as dt_time
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value):
+    """Encodes the date and time values found in model dictionaries"""
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class MemoryBackend:
+    """In-process stand-in for Redis implementing the commands SharedCache
+    uses (same signatures as redis-py), for development and tests"""
+
+    def __init__(self):
+        """Initializes an empty store"""
+        self.__lock = threading.Lock()
+        self.__data = {}  # key -> (value, expires_at or None)
+
+    def __live(self, key):
+        """Returns the value of key, dropping it if expired"""
+        entry = self.__data.get(key)
+        if entry and entry[1] is not None and entry[1] < time.monotonic():
+            del self.__data[key]
+            return None
+        return entry[0] if entry else None
+
+    def get(self, key):
+        with self.__lock:
+            return self.__live(key)
+
+    def mget(self, keys):
+        with self.__lock:
+            return [self.__live(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        with self.__lock:
+            if nx and self.__live(key) is not None:
+                return None
+            self.__data[key] = (str(value), time.monotonic() + ex if ex else None)
+            return True
+
+    def incr(self, key):
+        with self.__lock:
+            value = int(self.__live(key) or 0) + 1
+            expires_at = self.__data[key][1] if key in self.__data else None
+            self.__data[key] = (str(value), expires_at)
+            return value
+
+    def delete(self, *keys):
+        with self.__lock:
+            return sum(self.__data.pop(key, None) is not None for key in keys)
+
+    def flushdb(self):
+        with self.__lock:
+            self.__data.clear()
+
+
+class NullBackend:
+    """Backend that stores nothing, used outside development when no Redis
+    is configured: a per-process store could not see the version bumps of
+    other workers, so every lookup misses and values are always recomputed"""
+
+    def get(self, key):
+        return None
+
+    def mget(self, keys):
+        return [None] * len(keys)
+
+    def set(self, key, value, ex=None, nx=False):
+        return True
+
+    def incr(self, key):
+        return 0
+
+    def delete(self, *keys):
+        return 0
+
+    def flushdb(self):
+        pass
+
+
+class SharedCache:
+    """Cache shared by every worker through a Redis (or Redis-like) backend.
+
+    Keys are namespaced and embed the current version of every model they
+    depend on; writing a model bumps its version, which makes all
+    dependent entries unreachable at once. Misses are single-flight: one
+    worker computes the value under a lock while the others wait for it.
+    """
+
+    def __init__(self, backend, namespace='faithconnecthub', ttl=300, lock_timeout=10, wait_timeout=5):
+        """Initializes the cache on a backend"""
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.hits = self.misses = 0
+        self.__tracked = {}  # class name -> columns with per-value versions
+
+    @classmethod
+    def from_config(cls, config):
+        """Creates the cache on Redis if REDIS_URL is set
+
+        Without Redis, entries are kept in memory in development and tests
+        (a single process), and not kept at all otherwise.
+        """
+        if config.REDIS_URL:
+            import redis
+            backend = redis.Redis.from_url(config.REDIS_URL, decode_responses=True)
+        elif config.ENV in ('dev', 'test'):
+            backend = MemoryBackend()
+        else:
+            logger.warning("FaithConnectHub_REDIS_URL is not set: the shared cache is disabled")
+            backend = NullBackend()
+        return cls(backend, config.CACHE_NAMESPACE, config.CACHE_TTL)
+
+    def versions(self, names):
+        """Returns the current version of each dependency name, in order"""
+        if not names:
+            return []
+        values = self.backend.mget([f"{self.namespace}:version:{name}" for name in names])
+        return [int(value or 0) for value in values]
+
+    def bump(self, *names):
+        """Invalidates every entry depending on one of the names"""
+        for name in names:
+            self.backend.incr(f"{self.namespace}:version:{name}")
+
+    def track(self, cls, column):
+        """Keeps a version per value of cls.column, named '<class>.<column>:<value>',
+        bumped by writes of rows holding (or previously holding) that value"""
+        self.__tracked.setdefault(cls.__name__, []).append(column)
+
+    @staticmethod
+    def value_name(value):
+        """Returns the form of a tracked value used in version names"""
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()[:10] if hasattr(value, 'year') else value.isoformat()
+        return str(value)
+
+    def invalidate_writes(self, writes):
+        """Write listener bumping the class, object and tracked value versions
+        of committed writes"""
+        names = set()
+        for _, obj, previous in writes:
+            name = type(obj).__name__
+            names.add(name)
+            names.add(f"{name}:{obj.id}")
+            for column in self.__tracked.get(name, ()):
+                for value in (getattr(obj, column, None), previous.get(column)):
+                    if value is not None:
+                        names.add(f"{name}.{column}:{self.value_name(value)}")
+        self.bump(*sorted(names))
+
+    def key(self, name, params=None, depends_on=()):
+        """Builds the versioned key of an entry"""
+        versions = self.versions(list(depends_on))
+        seed = json.dumps([params or {}, versions], sort_keys=True, default=str)
+        return f"{self.namespace}:{name}:{hashlib.sha1(seed.encode()).hexdigest()}"
+
+    def get(self, key):
+        """Returns the decoded value stored at key, or None"""
+        value = self.backend.get(key)
+        return None if value is None else json.loads(value)
+
+    def get_or_set(self, name, params, producer, ttl=None, depends_on=()):
+        """Returns the cached value, computing it with producer() on a miss
+
+        The value must be JSON serializable (dates and times are stored as
+        ISO strings); it is always returned as decoded from JSON so hits and
+        misses look the same to the caller.
+        :param name: Entry name, e.g. 'finance_report'
+        :param params: Parameters the value depends on
+        :param producer: Callable computing the value
+        :param ttl: Seconds before the entry expires on its own (CACHE_TTL by default)
+        :param depends_on: Names (e.g. 'Event' or 'Event:<id>') whose writes invalidate the entry
+        """
+        key = self.key(name, params, depends_on)
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return json.loads(value)
+        self.misses += 1
+
+        lock_key, token = f"{key}:lock", uuid.uuid4().hex
+        if not self.backend.set(lock_key, token, ex=self.lock_timeout, nx=True):
+            # Someone else is computing it: wait for their result
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = self.backend.get(key)
+                if value is not None:
+                    return json.loads(value)
+            lock_key = None
+        try:
+            value = json.dumps(producer(), default=_json_default)
+            self.backend.set(key, value, ex=ttl or self.ttl)
+        finally:
+            if lock_key and self.backend.get(lock_key) == token:
+                self.backend.delete(lock_key)
+        return json.loads(value)
+
+    def stats(self):
+        """Returns the hit/miss counters of this worker"""
+        return {'backend': type(self.backend).__name__, 'hits': self.hits, 'misses': self.misses}
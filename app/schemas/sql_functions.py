@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""SQL date-bucketing functions compiled for each supported dialect"""
+from sqlalchemy import Date
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import GenericFunction
+
+
+class week_start(GenericFunction):
+    """Monday of the ISO week holding a date"""
+    type = Date()
+    inherit_cache = True
+
+
+class month_start(GenericFunction):
+    """First day of the month holding a date"""
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(week_start)
+def _week_start(element, compiler, **kw):
+    return "date_trunc('week', %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(week_start, 'mysql')
+def _week_start_mysql(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return "DATE_SUB(%s, INTERVAL WEEKDAY(%s) DAY)" % (value, value)
+
+
+@compiles(week_start, 'sqlite')
+def _week_start_sqlite(element, compiler, **kw):
+    # Forward to Sunday (or stay on it), then back six days
+    return "date(%s, 'weekday 0', '-6 days')" % compiler.process(element.clauses, **kw)
+
+
+@compiles(month_start)
+def _month_start(element, compiler, **kw):
+    return "date_trunc('month', %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(month_start, 'mysql')
+def _month_start_mysql(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return "DATE_SUB(%s, INTERVAL DAYOFMONTH(%s) - 1 DAY)" % (value, value)
+
+
+@compiles(month_start, 'sqlite')
+def _month_start_sqlite(element, compiler, **kw):
+    return "date(%s, 'start of month')" % compiler.process(element.clauses, **kw)
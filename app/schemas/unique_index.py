@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""In-memory pre-check for values of unique columns (usernames, emails)"""
+import logging
+import threading
+
+from sqlalchemy import select
+
+from app.utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class UniqueIndex:
+    """Bloom filters over the values of unique columns.
+
+    A negative answer means the value is definitely not stored yet, so the
+    duplicate lookup query can be skipped; a positive one must be confirmed
+    against the database. Values are lowercased so the filter is at least
+    as broad as a case-insensitive collation. The filters only learn the
+    writes committed by this process, so the database unique constraints
+    remain the source of truth.
+    """
+
+    def __init__(self, storage, columns, capacity=100000, error_rate=0.01):
+        """Initializes an empty index
+        :param storage: Storage the existing values are loaded from
+        :param columns: {model class: (unique column, ...)}
+        :param capacity: Minimum number of values each filter is sized for
+        :param error_rate: False-positive rate of each filter
+        """
+        self.__storage = storage
+        self.__columns = columns
+        self.__capacity = capacity
+        self.__error_rate = error_rate
+        self.__filters = None
+        self.__lock = threading.Lock()
+
+    def build(self):
+        """Loads every stored value, one query per class"""
+        filters = {}
+        for cls, columns in self.__columns.items():
+            rows = self.__storage.session.execute(select(*(getattr(cls, column) for column in columns))).all()
+            capacity = max(self.__capacity, 2 * len(rows))
+            for i, column in enumerate(columns):
+                bloom = filters[(cls.__name__, column)] = BloomFilter(capacity, self.__error_rate)
+                for row in rows:
+                    if row[i] is not None:
+                        bloom.add(row[i].lower())
+        with self.__lock:
+            self.__filters = filters
+        logger.info("Unique index built for %s", ', '.join(f"{n}.{c}" for n, c in filters))
+
+    def might_exist(self, cls, column, value):
+        """Returns False when no stored `cls` row can have `column` == value"""
+        if value is None:
+            return False
+        if self.__filters is None:
+            self.build()
+        bloom = self.__filters.get((cls.__name__, column))
+        return bloom is None or value.lower() in bloom
+
+    def apply(self, writes):
+        """Write listener adding the values of committed inserts and updates"""
+        if self.__filters is None:
+            return
+        stale = False
+        with self.__lock:
+            for operation, obj, previous in writes:
+                if operation == 'deleted':
+                    continue
+                for column in self.__columns.get(type(obj), ()):
+                    value = getattr(obj, column, None)
+                    if value is not None and (operation == 'new' or column in previous):
+                        bloom = self.__filters[(type(obj).__name__, column)]
+                        bloom.add(value.lower())
+                        stale = stale or bloom.count > bloom.capacity
+        if stale:
+            # Past capacity the false-positive rate climbs: rebuild, sized from the table
+            self.__filters = None
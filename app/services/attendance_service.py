@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""Handles business logic for attendance records and per-event rollups"""
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, case, delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from config import Config
+from app.models import storage, cache
+from app.models.attendance import Attendance
+from app.models.attendance_summary import EventAttendanceSummary
+from app.models.event import Event
+from app.models.member import Member
+from app.schemas.serializers import serializer_for
+from app.schemas.sql_functions import month_start, week_start
+
+SUMMARY_COUNTS = ['total', 'present', 'absent', 'guests', 'first_timers']
+TREND_INTERVALS = {'week': (week_start, 52), 'month': (month_start, 12)}  # bucket function, buckets per year
+TREND_STATUSES = ['PRESENT', 'ABSENT', 'ALL']
+
+
+class AttendanceService:
+    """Writes attendance records and keeps event_attendance_summaries, and
+    the members' last_attended_at and attendance_count, in step in the
+    same transaction, so turnout and last-seen reads are a single row"""
+
+    @staticmethod
+    def _counts(record, sign=1):
+        """Returns the summary deltas of one record (first-timers aside)"""
+        status = (record.status or '').upper()
+        return Counter({'total': sign, 'present': sign * (status == 'PRESENT'),
+                        'absent': sign * (status == 'ABSENT'), 'guests': sign * bool(record.is_guest)})
+
+    @staticmethod
+    def _first_timers(member_ids):
+        """Returns the members, among member_ids, without any stored attendance"""
+        member_ids = {member_id for member_id in member_ids if member_id}
+        if not member_ids:
+            return set()
+        seen = storage.query(Attendance.member_id).filter(Attendance.member_id.in_(member_ids)).distinct()
+        return member_ids - {member_id for (member_id,) in seen}
+
+    @staticmethod
+    def _firsts(member_ids=None):
+        """Returns the query of each member's first record (earliest
+        created_at, ties broken by id) as (member_id, event_id), for the
+        given members only if member_ids is set"""
+        position = func.row_number().over(partition_by=Attendance.member_id,
+                                          order_by=(Attendance.created_at, Attendance.id)).label('position')
+        ranked = select(Attendance.member_id, Attendance.event_id, position).where(
+            Attendance.member_id.isnot(None) if member_ids is None else Attendance.member_id.in_(member_ids)
+        ).subquery()
+        return select(ranked.c.member_id, ranked.c.event_id).where(ranked.c.position == 1)
+
+    @staticmethod
+    def _first_events(member_ids):
+        """Returns {member_id: event id of the member's first record, or
+        None} for the members among member_ids, as currently flushed"""
+        member_ids = {member_id for member_id in member_ids if member_id}
+        if not member_ids:
+            return {}
+        rows = storage.session.execute(AttendanceService._firsts(member_ids)).all()
+        return dict.fromkeys(member_ids) | dict(rows)
+
+    @staticmethod
+    def _move_first_timers(deltas, before, after):
+        """Moves a first-timer from the event each member's first record was
+        at to the one it is at now, for the members whose first event changed"""
+        for member_id, event_id in before.items():
+            if after.get(member_id) == event_id:
+                continue
+            if event_id:
+                deltas[event_id]['first_timers'] -= 1
+            if after.get(member_id):
+                deltas[after[member_id]]['first_timers'] += 1
+
+    @staticmethod
+    def _apply(deltas):
+        """Adds {event_id: Counter} deltas to the summary rows; runs in the
+        current transaction"""
+        session = storage.session
+        for event_id, counts in deltas.items():
+            counts = {name: counts.get(name, 0) for name in SUMMARY_COUNTS}
+            if not any(counts.values()):
+                continue
+            values = {name: getattr(EventAttendanceSummary, name) + delta for name, delta in counts.items()}
+            updated = session.execute(
+                update(EventAttendanceSummary).where(EventAttendanceSummary.event_id == event_id)
+                .values(updated_at=datetime.now(), **values)
+            ).rowcount
+            if not updated:
+                session.add(EventAttendanceSummary(event_id=event_id, **counts))
+
+    @staticmethod
+    def _day(value):
+        """Returns the date of an attendance date value (a date, datetime,
+        YYYY-MM-DD string, or None for today)"""
+        if value is None:
+            return date.today()
+        if isinstance(value, str):
+            return date.fromisoformat(value[:10])
+        if isinstance(value, datetime):
+            return value.date()
+        return value
+
+    @staticmethod
+    def _touch_members(records):
+        """Adds new records to their members' attendance count and moves
+        last_attended_at forward; runs in the current transaction"""
+        seen = defaultdict(list)
+        for record in records:
+            if record.member_id and (record.status or '').upper() == 'PRESENT':
+                seen[record.member_id].append(AttendanceService._day(record.date))
+        for member_id, days in seen.items():
+            last = max(days)
+            storage.session.execute(
+                update(Member).where(Member.id == member_id).values(
+                    attendance_count=Member.attendance_count + len(days),
+                    last_attended_at=case(
+                        (or_(Member.last_attended_at.is_(None), Member.last_attended_at < last), last),
+                        else_=Member.last_attended_at,
+                    ),
+                ).execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def _refresh_members(member_ids=None):
+        """Recomputes last_attended_at and attendance_count of the members
+        (every member if None) from their PRESENT records; runs in the
+        current transaction and returns the number of members updated"""
+        present = and_(Attendance.member_id == Member.id, func.upper(Attendance.status) == 'PRESENT')
+        stmt = update(Member).values(
+            attendance_count=select(func.count()).where(present).scalar_subquery(),
+            last_attended_at=select(func.max(Attendance.date)).where(present).scalar_subquery(),
+        ).execution_options(synchronize_session=False)
+        if member_ids is not None:
+            member_ids = {member_id for member_id in member_ids if member_id}
+            if not member_ids:
+                return 0
+            stmt = stmt.where(Member.id.in_(member_ids))
+        return storage.session.execute(stmt).rowcount
+
+    @staticmethod
+    def _commit(write):
+        """Runs write() and commits, retrying once if a concurrent request
+        created the same summary row first"""
+        try:
+            write()
+            storage.save()
+        except IntegrityError:
+            storage.rollback()
+            write()
+            storage.save()
+
+    @staticmethod
+    def create_records(records):
+        """Creates attendance records, possibly for several events"""
+        def write():
+            deltas = defaultdict(Counter)
+            first_timers = AttendanceService._first_timers(record.member_id for record in records)
+            for record in records:
+                deltas[record.event_id].update(AttendanceService._counts(record))
+            storage.bulk_new(records)
+            storage.session.flush()
+            # Read back, so records tied on created_at are ordered as a rebuild orders them
+            for event_id in AttendanceService._first_events(first_timers).values():
+                deltas[event_id]['first_timers'] += 1
+            AttendanceService._apply(deltas)
+            AttendanceService._touch_members(records)
+
+        AttendanceService._commit(write)
+        return records
+
+    @staticmethod
+    def update_record(record, data):
+        """Updates an attendance record"""
+        old = {'event_id': record.event_id, 'member_id': record.member_id}
+        old_counts = AttendanceService._counts(record, -1)
+
+        def write():
+            member_ids = [old['member_id'], data.get('member_id', record.member_id)]
+            with storage.session.no_autoflush:
+                before = AttendanceService._first_events(member_ids)
+            for key, value in data.items():
+                setattr(record, key, value)
+            record.updated_at = datetime.now()
+            storage.new(record)
+            storage.session.flush()
+            deltas = defaultdict(Counter)
+            deltas[old['event_id']].update(old_counts)
+            deltas[record.event_id].update(AttendanceService._counts(record))
+            AttendanceService._move_first_timers(deltas, before, AttendanceService._first_events(member_ids))
+            AttendanceService._apply(deltas)
+            AttendanceService._refresh_members(member_ids)
+
+        AttendanceService._commit(write)
+        return record
+
+    @staticmethod
+    def delete_record(record):
+        """Deletes an attendance record"""
+        def write():
+            before = AttendanceService._first_events([record.member_id])
+            storage.delete(record)
+            storage.session.flush()
+            deltas = defaultdict(Counter)
+            deltas[record.event_id].update(AttendanceService._counts(record, -1))
+            AttendanceService._move_first_timers(deltas, before, AttendanceService._first_events([record.member_id]))
+            AttendanceService._apply(deltas)
+            AttendanceService._refresh_members([record.member_id])
+
+        AttendanceService._commit(write)
+
+    @staticmethod
+    def backfill_members():
+        """Recomputes every member's last_attended_at and attendance_count in
+        one transaction; returns the number of members updated"""
+        rows = AttendanceService._refresh_members()
+        storage.save()
+        return rows
+
+    @staticmethod
+    def lapsed_query(weeks, status='active'):
+        """Returns the query of the members with a status who attended
+        before, but not within the last `weeks` weeks (an index range scan
+        on (status, last_attended_at)).
+        Raises ValueError unless weeks is a positive integer."""
+        try:
+            weeks = int(weeks)
+        except (TypeError, ValueError):
+            raise ValueError("weeks must be an integer")
+        if weeks < 1:
+            raise ValueError("weeks must be greater than 0")
+        since = date.today() - timedelta(weeks=weeks)
+        return storage.query(Member, read_only=True).filter(Member.status == status,
+                                                             Member.last_attended_at < since)
+
+    @staticmethod
+    def summary(event_id):
+        """Returns the turnout counts of an event, or None if it has no records"""
+        row = storage.query(EventAttendanceSummary, read_only=True).filter_by(event_id=event_id).first()
+        if row is None:
+            return None
+        return {name: getattr(row, name) for name in ['event_id'] + SUMMARY_COUNTS}
+
+    @staticmethod
+    def date_range_query(start_date, end_date, **filters):
+        """Returns the query of the records dated within [start_date, end_date]
+        whose columns equal the filters"""
+        query = storage.query(Attendance, read_only=True).filter(Attendance.date.between(start_date, end_date))
+        for column, value in filters.items():
+            query = query.filter(getattr(Attendance, column) == value)
+        return query.order_by(Attendance.date, Attendance.id)
+
+    @staticmethod
+    def parse_range(start_date, end_date):
+        """Returns the (start, end) dates of a range given as YYYY-MM-DD
+        strings (or dates); raises ValueError for anything else"""
+        try:
+            return tuple(value if isinstance(value, date) else date.fromisoformat(value)
+                         for value in (start_date, end_date))
+        except TypeError:
+            raise ValueError("dates must be strings")
+
+    @staticmethod
+    def date_range(start_date, end_date, **filters):
+        """Returns the serialized records of a date-range query
+
+        Results are kept in the shared cache under the normalized filters and
+        depend on one version per day of the window, so only writes dated
+        inside it invalidate them. Windows longer than
+        ATTENDANCE_RANGE_CACHE_MAX_DAYS are not cached.
+        Raises ValueError unless both dates are YYYY-MM-DD strings (or dates).
+        """
+        start, end = AttendanceService.parse_range(start_date, end_date)
+        days = (end - start).days + 1
+        if days < 1:
+            return []
+
+        def produce():
+            query = AttendanceService.date_range_query(start, end, **filters)
+            return serializer_for(Attendance).many(query.all())
+
+        if days > Config.ATTENDANCE_RANGE_CACHE_MAX_DAYS:
+            return produce()
+        params = dict(filters, start_date=start.isoformat(), end_date=end.isoformat())
+        depends_on = [f"Attendance.date:{start + timedelta(days=n)}" for n in range(days)]
+        return cache.get_or_set('attendance_range', params, produce,
+                                ttl=Config.ATTENDANCE_RANGE_CACHE_TTL, depends_on=depends_on)
+
+    @staticmethod
+    def _bucket(interval, day):
+        """Returns the ordinal of the week (Monday-based) or month holding day"""
+        if interval == 'week':
+            return (day.toordinal() - 1) // 7
+        return day.year * 12 + day.month - 1
+
+    @staticmethod
+    def _bucket_label(interval, key):
+        """Returns the first day of a bucket ordinal, as YYYY-MM-DD"""
+        if interval == 'week':
+            return date.fromordinal(key * 7 + 1).isoformat()
+        return f"{key // 12:04d}-{key % 12 + 1:02d}-01"
+
+    @staticmethod
+    def _trend_series(counts, first, last, window, per_year):
+        """Returns the counts, trailing moving averages and year-over-year
+        comparison of the buckets [first, last] of a {bucket: count} dict"""
+        series = {'counts': [], 'moving_average': [], 'previous_year': [], 'yoy_change': []}
+        for key in range(first, last + 1):
+            current = counts.get(key, 0)
+            previous = counts.get(key - per_year, 0)
+            series['counts'].append(current)
+            series['moving_average'].append(round(sum(counts.get(key - n, 0) for n in range(window)) / window, 2))
+            series['previous_year'].append(previous)
+            series['yoy_change'].append(round((current - previous) * 100 / previous, 2) if previous else None)
+        series['total'] = sum(series['counts'])
+        return series
+
+    @staticmethod
+    def build_trends(interval, start, end, category=None, status='PRESENT', window=4):
+        """Computes attendance counts per bucket and event category
+
+        The database groups the records by bucket and category in a single
+        query over the window plus its lead-in (the previous year, and the
+        buckets the first moving averages reach back to), so only
+        O(buckets x categories) rows are read whatever the attendance size.
+        """
+        bucket_of, per_year = TREND_INTERVALS[interval]
+        first, last = AttendanceService._bucket(interval, start), AttendanceService._bucket(interval, end)
+        lead_in = max(per_year, window - 1)
+        since = date.fromisoformat(AttendanceService._bucket_label(interval, first - lead_in))
+
+        bucket = bucket_of(Attendance.date)
+        stmt = select(bucket, Event.category, func.count()).join(Event, Attendance.event_id == Event.id) \
+            .where(Attendance.date.between(since, end)).group_by(bucket, Event.category)
+        if status != 'ALL':
+            stmt = stmt.where(func.upper(Attendance.status) == status)
+        if category:
+            stmt = stmt.where(Event.category == category)
+
+        per_category, overall = defaultdict(Counter), Counter()
+        for day, name, count in storage.reader().execute(stmt):
+            # MySQL returns dates, SQLite returns YYYY-MM-DD strings
+            key = AttendanceService._bucket(interval, date.fromisoformat(str(day)[:10]))
+            per_category[name][key] += count
+            overall[key] += count
+
+        return {
+            'interval': interval, 'start_date': start.isoformat(), 'end_date': end.isoformat(),
+            'status': status, 'window': window,
+            'periods': [AttendanceService._bucket_label(interval, key) for key in range(first, last + 1)],
+            'overall': AttendanceService._trend_series(overall, first, last, window, per_year),
+            'categories': [dict(category=name, **AttendanceService._trend_series(counts, first, last, window, per_year))
+                           for name, counts in sorted(per_category.items())],
+        }
+
+    @staticmethod
+    def trends(interval='week', start_date=None, end_date=None, category=None, status='PRESENT', window=4):
+        """Returns the attendance trends of [start_date, end_date] (the last
+        year up to today by default), cached until an attendance record or
+        an event is written.
+        Raises ValueError for an unknown interval or status, a malformed
+        date or window, or a window of more than a year of buckets."""
+        if interval not in TREND_INTERVALS:
+            raise ValueError(f"interval must be one of {', '.join(TREND_INTERVALS)}")
+        status = (status or 'PRESENT').upper()
+        if status not in TREND_STATUSES:
+            raise ValueError(f"status must be one of {', '.join(TREND_STATUSES)}")
+        try:
+            window = int(window)
+        except (TypeError, ValueError):
+            raise ValueError("window must be an integer")
+        if not 1 <= window <= TREND_INTERVALS[interval][1]:
+            raise ValueError(f"window must be between 1 and {TREND_INTERVALS[interval][1]}")
+        try:
+            end = date.fromisoformat(end_date) if end_date else date.today()
+            start = date.fromisoformat(start_date) if start_date else end - timedelta(days=364)
+        except (TypeError, ValueError):
+            raise ValueError("start_date and end_date must be formatted as YYYY-MM-DD")
+        if start > end:
+            raise ValueError("start_date must not be after end_date")
+
+        params = {'interval': interval, 'start_date': start.isoformat(), 'end_date': end.isoformat(),
+                  'category': category, 'status': status, 'window': window}
+        return cache.get_or_set('attendance_trends', params,
+                                lambda: AttendanceService.build_trends(interval, start, end, category, status, window),
+                                depends_on=['Attendance', 'Event'])
+
+    @staticmethod
+    def rebuild_summary():
+        """Recomputes event_attendance_summaries from the attendance records in
+        one transaction; returns the number of summary rows"""
+        status = func.upper(Attendance.status)
+        counts = select(
+            Attendance.event_id, func.count(),
+            func.sum(case((status == 'PRESENT', 1), else_=0)),
+            func.sum(case((status == 'ABSENT', 1), else_=0)),
+            func.sum(case((Attendance.is_guest.is_(True), 1), else_=0)),
+        ).group_by(Attendance.event_id)
+
+        firsts = AttendanceService._firsts().subquery()
+        first_timers = select(firsts.c.event_id, func.count()).group_by(firsts.c.event_id)
+
+        session = storage.session
+        first_counts = dict(session.execute(first_timers).all())
+        rows = [EventAttendanceSummary(event_id=event_id, total=total, present=present, absent=absent,
+                                       guests=guests, first_timers=first_counts.get(event_id, 0))
+                for event_id, total, present, absent, guests in session.execute(counts).all()]
+        session.execute(delete(EventAttendanceSummary))
+        storage.bulk_new(rows)
+        storage.save()
+        return len(rows)
@@ -12,9 +12,8 @@ class AuthService:
     @staticmethod
     def register_user(data):
         """Registers a new user"""
-        # Check for existing user email
-        if storage.query(User).filter_by(email=data['email']).first() or \
-            storage.query(User).filter_by(username=data['username']).first():
+        # Check for existing user email (skips the query when the unique index rules it out)
+        if User.check_duplicate_email(data['email']) or User.check_duplicate_username(data['username']):
             return None
 
         # Check for missing email, password or username
@@ -35,7 +34,10 @@ class AuthService:
             role=data.get('role', 'MEMBER')
         )
         user.set_password(data['password'])
-        user.save()
+        try:
+            user.save()
+        except ValueError:
+            return None
 
         return user, 201
 
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Scores member engagement in batch and serves the ranking"""
+import uuid
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import case, delete, func, insert, select, union_all
+
+from config import Config
+from app.models import storage
+from app.models.association_tables import member_department, member_group
+from app.models.attendance import Attendance
+from app.models.engagement_score import MemberEngagementScore
+from app.models.member import Member
+
+WINDOWS = [4, 13, 52]  # weeks
+FREQUENCY_WEIGHTS = np.array([0.5, 0.3, 0.2])  # per window, shortest first
+RECENCY_HALF_LIFE = 28  # days
+MEMBERSHIP_CAP = 3  # groups + departments counted towards the score
+SCORE_WEIGHTS = {'recency': 0.4, 'frequency': 0.45, 'involvement': 0.15}
+ORDERS = ['top', 'bottom']
+
+
+class EngagementService:
+    """Computes a recency/frequency engagement score for every member
+
+    Three set-based queries feed the job (members, attendance per member
+    over the longest window, memberships per member); the scores and ranks
+    are then computed as arrays and the score table is replaced in one
+    transaction.
+    """
+
+    @staticmethod
+    def _fetch(as_of):
+        """Returns the member ids and, aligned with them, arrays of the last
+        attendance, attendance counts per window and memberships"""
+        session = storage.session
+        ids = np.array(session.execute(select(Member.id).order_by(Member.id)).scalars().all(), dtype=str)
+        position = {member_id: i for i, member_id in enumerate(ids.tolist())}
+
+        # Present records of the longest window only: an index range scan
+        # on date, whatever the length of the history
+        since = as_of - timedelta(weeks=WINDOWS[-1])
+        windows = [func.sum(case((Attendance.date > as_of - timedelta(weeks=weeks), 1), else_=0)) for weeks in WINDOWS]
+        attendance = select(Attendance.member_id, func.max(Attendance.date), *windows).where(
+            Attendance.date > since, Attendance.date <= as_of, func.upper(Attendance.status) == 'PRESENT',
+            Attendance.member_id.isnot(None)
+        ).group_by(Attendance.member_id)
+
+        last_attended = np.full(len(ids), -1, dtype=np.int64)  # days since, -1 if never
+        attended = np.zeros((len(ids), len(WINDOWS)), dtype=np.int64)
+        for member_id, last, *counts in session.execute(attendance):
+            i = position.get(member_id)
+            if i is not None:
+                # MySQL returns dates, SQLite returns YYYY-MM-DD strings
+                last_attended[i] = (as_of - date.fromisoformat(str(last)[:10])).days
+                attended[i] = counts
+
+        links = union_all(select(member_group.c.member_id), select(member_department.c.member_id)).subquery()
+        memberships = np.zeros(len(ids), dtype=np.int64)
+        for member_id, count in session.execute(select(links.c.member_id, func.count()).group_by(links.c.member_id)):
+            i = position.get(member_id)
+            if i is not None:
+                memberships[i] = count
+        return ids, last_attended, attended, memberships
+
+    @staticmethod
+    def score(last_attended, attended, memberships):
+        """Returns the scores (0 to 100) of the members' arrays
+
+        :param last_attended: Days since each member last attended, -1 if never
+        :param attended: Attendance counts per window (one column per WINDOWS entry)
+        :param memberships: Number of groups and departments of each member
+        """
+        recency = np.where(last_attended >= 0, 0.5 ** (np.maximum(last_attended, 0) / RECENCY_HALF_LIFE), 0.0)
+        frequency = np.minimum(attended / np.array(WINDOWS), 1.0) @ FREQUENCY_WEIGHTS
+        involvement = np.minimum(memberships / MEMBERSHIP_CAP, 1.0)
+        score = (SCORE_WEIGHTS['recency'] * recency + SCORE_WEIGHTS['frequency'] * frequency
+                 + SCORE_WEIGHTS['involvement'] * involvement)
+        return (100 * score).round(2)
+
+    @staticmethod
+    def compute(as_of=None):
+        """Recomputes member_engagement_scores as of a day (today by
+        default); returns the number of members scored"""
+        as_of = as_of or date.today()
+        ids, last_attended, attended, memberships = EngagementService._fetch(as_of)
+        scores = EngagementService.score(last_attended, attended, memberships)
+
+        # Highest score first, ties broken by member id
+        ranks = np.empty(len(ids), dtype=np.int64)
+        ranks[np.lexsort((ids, -scores))] = np.arange(1, len(ids) + 1)
+
+        now = datetime.now()
+        rows = [{'id': str(uuid.uuid4()), 'created_at': now, 'updated_at': now, 'member_id': member_id,
+                 'as_of': as_of, 'last_attended': as_of - timedelta(days=days) if days >= 0 else None,
+                 'attended_4w': counts[0], 'attended_13w': counts[1], 'attended_52w': counts[2],
+                 'memberships': links, 'score': score, 'rank': rank}
+                for member_id, days, counts, links, score, rank in zip(
+                    ids.tolist(), last_attended.tolist(), attended.tolist(), memberships.tolist(),
+                    scores.tolist(), ranks.tolist())]
+
+        # Core executemany on the table: one round trip per batch, no ORM objects
+        session = storage.session
+        session.execute(delete(MemberEngagementScore))
+        for start in range(0, len(rows), Config.BULK_BATCH_SIZE):
+            session.execute(insert(MemberEngagementScore.__table__), rows[start:start + Config.BULK_BATCH_SIZE])
+        storage.save()
+        return len(rows)
+
+    @staticmethod
+    def ranked(limit, cursor=None, order='top'):
+        """Returns one keyset page of the ranking joined to the members
+
+        `order` is 'top' (most engaged first) or 'bottom' (those who need
+        encouragement first); `cursor` is the rank returned as next_cursor
+        by the previous call.
+        Returns a tuple (rows, next_cursor); next_cursor is None on the last page.
+        Raises ValueError for an unknown order or a malformed cursor.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"order must be one of {', '.join(ORDERS)}")
+        rank = MemberEngagementScore.rank
+        stmt = select(MemberEngagementScore, Member.first_name, Member.last_name, Member.email, Member.status) \
+            .join(Member, Member.id == MemberEngagementScore.member_id)
+        if cursor:
+            try:
+                cursor = int(cursor)
+            except ValueError:
+                raise ValueError("Invalid cursor")
+            stmt = stmt.where(rank > cursor if order == 'top' else rank < cursor)
+        stmt = stmt.order_by(rank if order == 'top' else rank.desc()).limit(limit + 1)
+        rows = storage.reader().execute(stmt).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = str(rows[-1][0].rank)
+        return [dict(score.to_dict(), first_name=first_name, last_name=last_name, email=email, status=status)
+                for score, first_name, last_name, email, status in rows], next_cursor
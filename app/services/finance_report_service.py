@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Builds financial statements from financial records with NumPy"""
+from datetime import date
+
+import numpy as np
+from sqlalchemy import case, extract, func, select
+
+from app.models import storage, cache
+from app.models.finance import FinancialRecord
+
+PERIODS = ['month', 'quarter', 'year']
+DIMENSIONS = {'category': FinancialRecord.category, 'department': FinancialRecord.department_id,
+              'event': FinancialRecord.event_id}
+
+
+class FinanceReportService:
+    """Computes income-versus-expense statements per period, optionally
+    broken down by a dimension. Monthly sums are read in one query and
+    folded, differenced and accumulated as arrays, so no FinancialRecord
+    objects are built."""
+
+    @staticmethod
+    def _fetch(dimension, start_date=None, end_date=None):
+        """Returns (year, month, is_income, amount, dimension values) arrays
+
+        The database sums the amounts per month, income flag and dimension
+        value in the same single query, so only O(months x values) rows
+        cross the wire whatever the number of records.
+        """
+        keys = [extract('year', FinancialRecord.date), extract('month', FinancialRecord.date),
+                case((func.lower(FinancialRecord.type) == 'income', 1), else_=0)]
+        if dimension:
+            keys.append(DIMENSIONS[dimension])
+        stmt = select(*keys, func.sum(FinancialRecord.amount)).group_by(*keys)
+        if start_date:
+            stmt = stmt.where(FinancialRecord.date >= start_date)
+        if end_date:
+            stmt = stmt.where(FinancialRecord.date <= end_date)
+        rows = storage.reader().execute(stmt).all()
+
+        columns = list(zip(*rows)) or [()] * (len(keys) + 1)
+        return (np.array(columns[0], dtype=np.int64), np.array(columns[1], dtype=np.int64),
+                np.array(columns[2], dtype=np.int64), np.array(columns[-1], dtype=np.float64),
+                np.array(columns[3], dtype=object) if dimension else None)
+
+    @staticmethod
+    def _label(period, key):
+        """Returns the label of a period key"""
+        if period == 'month':
+            return f"{key // 12:04d}-{key % 12 + 1:02d}"
+        if period == 'quarter':
+            return f"{key // 4:04d}-Q{key % 4 + 1}"
+        return f"{key:04d}"
+
+    @staticmethod
+    def _series(income, expense):
+        """Returns the statement series of income and expense arrays"""
+        net = income - expense
+        change = np.diff(net, prepend=np.nan)
+        return {
+            'income': income.round(2).tolist(),
+            'expense': expense.round(2).tolist(),
+            'net': net.round(2).tolist(),
+            'net_change': [None if np.isnan(value) else value for value in change.round(2).tolist()],
+            'balance': np.cumsum(net).round(2).tolist(),
+            'totals': {'income': round(float(income.sum()), 2), 'expense': round(float(expense.sum()), 2),
+                       'net': round(float(net.sum()), 2)},
+        }
+
+    @staticmethod
+    def build(period='month', by=None, start_date=None, end_date=None):
+        """Computes the statement of the records in [start_date, end_date]
+
+        :param period: 'month', 'quarter' or 'year'
+        :param by: Optional breakdown: 'category', 'department' or 'event'
+        :return: Labels of every period between the first and last record,
+                 the overall statement (income, expense, net, net_change
+                 versus the previous period and running balance) and, with
+                 `by`, one statement per dimension value
+        """
+        years, months, is_income, amounts, values = FinanceReportService._fetch(by, start_date, end_date)
+        report = {'period': period, 'by': by, 'start_date': start_date, 'end_date': end_date}
+
+        if period == 'month':
+            keys = years * 12 + months - 1
+        elif period == 'quarter':
+            keys = years * 4 + (months - 1) // 3
+        else:
+            keys = years
+        first = int(keys.min()) if keys.size else 0
+        n_periods = int(keys.max()) - first + 1 if keys.size else 0
+        report['periods'] = [FinanceReportService._label(period, first + i) for i in range(n_periods)]
+
+        if by:
+            # Missing departments/events are grouped under None
+            values[values == None] = ''  # noqa: E711  (element-wise comparison)
+            names, groups = np.unique(values.astype(str), return_inverse=True)
+        else:
+            names, groups = np.array(['']), np.zeros(keys.size, dtype=np.int64)
+
+        # One bincount over (group, period, income flag) yields every total at once
+        cells = (groups * n_periods + (keys - first)) * 2 + is_income
+        totals = np.bincount(cells, weights=amounts, minlength=len(names) * n_periods * 2)
+        totals = totals.reshape(len(names), n_periods, 2)
+
+        overall = totals.sum(axis=0)
+        report['statement'] = FinanceReportService._series(overall[:, 1], overall[:, 0])
+        if by:
+            report['groups'] = [dict(key=name or None, **FinanceReportService._series(totals[i, :, 1], totals[i, :, 0]))
+                                for i, name in enumerate(names.tolist())]
+        return report
+
+    @staticmethod
+    def report(period='month', by=None, start_date=None, end_date=None):
+        """Returns the statement, cached until a financial record is written.
+        Raises ValueError for an unknown period or breakdown, or a malformed date."""
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {', '.join(PERIODS)}")
+        if by and by not in DIMENSIONS:
+            raise ValueError(f"by must be one of {', '.join(DIMENSIONS)}")
+        try:
+            for value in (start_date, end_date):
+                if value:
+                    date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("start_date and end_date must be formatted as YYYY-MM-DD")
+
+        params = {'period': period, 'by': by, 'start_date': start_date, 'end_date': end_date}
+        return cache.get_or_set('finance_report', params,
+                                lambda: FinanceReportService.build(period, by, start_date, end_date),
+                                depends_on=['FinancialRecord'])
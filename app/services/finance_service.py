@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Handles business logic for financial records and their monthly summaries"""
+import math
+from datetime import date, datetime
+
+from sqlalchemy import delete, extract, func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models import storage
+from app.models.finance import FinancialRecord
+from app.models.finance_summary import FinancialSummary
+
+SUMMARY_DIMENSIONS = ['period', 'type', 'category', 'department_id', 'group_id']
+
+
+class FinanceService:
+    """Writes financial records and keeps financial_summaries in step, in
+    the same transaction, so summary reads never scan financial_records"""
+
+    @staticmethod
+    def _period(value):
+        """Returns the YYYYMM period of a date (or YYYY-MM-DD string)"""
+        if isinstance(value, str):
+            value = date.fromisoformat(value[:10])
+        return value.year * 100 + value.month
+
+    @staticmethod
+    def _key(record):
+        """Returns the summary key of a record"""
+        return (FinanceService._period(record.date), record.type, record.category,
+                record.department_id or '', record.group_id or '')
+
+    @staticmethod
+    def _amount(value):
+        """Returns an amount as a float, 0.0 when missing (the column
+        default); raises ValueError unless it is a finite number"""
+        if value is None:
+            return 0.0
+        if isinstance(value, bool):
+            raise ValueError("amount must be a number")
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError("amount must be a number")
+        if not math.isfinite(value):
+            raise ValueError("amount must be a number")
+        return value
+
+    @staticmethod
+    def _date(value):
+        """Returns a date given as YYYY-MM-DD (or a date); raises ValueError otherwise"""
+        if isinstance(value, date):
+            return value
+        try:
+            return date.fromisoformat(value[:10])
+        except (TypeError, ValueError):
+            raise ValueError("date must be formatted as YYYY-MM-DD")
+
+    @staticmethod
+    def _apply(key, amount, count):
+        """Adds amount and count to the summary row of key, creating or
+        removing the row as needed; runs in the current transaction"""
+        session = storage.session
+        where = [getattr(FinancialSummary, name) == value for name, value in zip(SUMMARY_DIMENSIONS, key)]
+        updated = session.execute(
+            update(FinancialSummary).where(*where).values(
+                total=FinancialSummary.total + amount, count=FinancialSummary.count + count,
+                updated_at=datetime.now())
+        ).rowcount
+        if not updated and count > 0:
+            session.add(FinancialSummary(**dict(zip(SUMMARY_DIMENSIONS, key)), total=amount, count=count))
+        elif count < 0:
+            session.execute(delete(FinancialSummary).where(*where, FinancialSummary.count <= 0))
+
+    @staticmethod
+    def _commit(write):
+        """Runs write() and commits, retrying once if a concurrent request
+        created the same summary row first"""
+        try:
+            write()
+            storage.save()
+        except IntegrityError:
+            storage.rollback()
+            write()
+            storage.save()
+
+    @staticmethod
+    def create_record(data):
+        """Creates a financial record; raises ValueError for a malformed amount"""
+        record = FinancialRecord(**dict(data, amount=FinanceService._amount(data.get('amount'))))
+
+        def write():
+            FinanceService._apply(FinanceService._key(record), record.amount, 1)
+            storage.new(record)
+
+        FinanceService._commit(write)
+        return record
+
+    @staticmethod
+    def update_record(record, data):
+        """Updates a financial record; raises ValueError, naming the field,
+        for a malformed date or amount, before anything is changed"""
+        data = dict(data)
+        if 'date' in data:
+            data['date'] = FinanceService._date(data['date'])
+        if 'amount' in data:
+            data['amount'] = FinanceService._amount(data['amount'])
+        old_key, old_amount = FinanceService._key(record), FinanceService._amount(record.amount)
+
+        def write():
+            for key, value in data.items():
+                setattr(record, key, value)
+            record.updated_at = datetime.now()
+            FinanceService._apply(old_key, -old_amount, -1)
+            FinanceService._apply(FinanceService._key(record), FinanceService._amount(record.amount), 1)
+            storage.new(record)
+
+        FinanceService._commit(write)
+        return record
+
+    @staticmethod
+    def delete_record(record):
+        """Deletes a financial record"""
+        def write():
+            FinanceService._apply(FinanceService._key(record), -FinanceService._amount(record.amount), -1)
+            storage.delete(record)
+
+        FinanceService._commit(write)
+
+    @staticmethod
+    def summary(group_by=None, start=None, end=None, **filters):
+        """Returns monthly totals read from financial_summaries
+
+        :param group_by: Dimensions to keep (defaults to all of them)
+        :param start: First period, as YYYY-MM
+        :param end: Last period, as YYYY-MM
+        :param filters: Equality filters on type, category, department_id or group_id
+        """
+        group_by = group_by or SUMMARY_DIMENSIONS
+        columns = [getattr(FinancialSummary, name) for name in group_by]
+        stmt = select(*columns, func.sum(FinancialSummary.total).label('total'),
+                      func.sum(FinancialSummary.count).label('count'))
+        if start:
+            stmt = stmt.where(FinancialSummary.period >= FinanceService._period(start + '-01'))
+        if end:
+            stmt = stmt.where(FinancialSummary.period <= FinanceService._period(end + '-01'))
+        for name, value in filters.items():
+            stmt = stmt.where(getattr(FinancialSummary, name) == value)
+        stmt = stmt.group_by(*columns).order_by(*columns)
+
+        rows = []
+        for row in storage.reader().execute(stmt):
+            row = dict(row._mapping)
+            if 'period' in row:
+                row['period'] = f"{row['period'] // 100:04d}-{row['period'] % 100:02d}"
+            for name in ('department_id', 'group_id'):
+                if name in row:
+                    row[name] = row[name] or None
+            row['total'] = round(row['total'], 2)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def rebuild_summary():
+        """Recomputes financial_summaries from financial_records in one
+        transaction; returns the number of summary rows"""
+        period = extract('year', FinancialRecord.date) * 100 + extract('month', FinancialRecord.date)
+        dimensions = [period, FinancialRecord.type, FinancialRecord.category,
+                      func.coalesce(FinancialRecord.department_id, ''), func.coalesce(FinancialRecord.group_id, '')]
+        stmt = select(*dimensions, func.sum(FinancialRecord.amount), func.count()).group_by(*dimensions)
+
+        session = storage.session
+        rows = session.execute(stmt).all()
+        session.execute(delete(FinancialSummary))
+        storage.bulk_new([FinancialSummary(**dict(zip(SUMMARY_DIMENSIONS, row[:5])), total=row[5], count=row[6])
+                          for row in rows])
+        storage.save()
+        return len(rows)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Reports attendance participation by member demographics"""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, case, func, select
+
+from app.models import storage, cache
+from app.models.attendance import Attendance
+from app.models.member import Member
+
+AGE_BANDS = [18, 30, 45, 60]  # lower bounds of the bands after '0-17'
+SEGMENTS = ['gender', 'marital_status', 'age_band', 'status']
+COUNTS = ['members', 'attending_members', 'records', 'present']
+
+
+class ParticipationReportService:
+    """Splits attendance participation by gender, marital status, age band
+    and membership status. Every member is joined to its attendance once,
+    in a single grouped query, so the database returns one row per
+    demographic segment whatever the number of members or records."""
+
+    @staticmethod
+    def _age_band(as_of):
+        """Returns the CASE expression of a member's age band on as_of"""
+        labels = [f"{low}-{high - 1}" for low, high in zip([0] + AGE_BANDS, AGE_BANDS)] + [f"{AGE_BANDS[-1]}+"]
+        whens = []
+        for low, label in zip(AGE_BANDS, labels):
+            # Born after the day one turns `low`: younger than `low`
+            born = datetime(as_of.year - low, as_of.month, 28 if (as_of.month, as_of.day) == (2, 29) else as_of.day)
+            whens.append((Member.date_of_birth > born, label))
+        return case(*whens, else_=labels[-1])
+
+    @staticmethod
+    def _rate(counts):
+        """Adds the share of members who attended to a dict of counts"""
+        counts['participation_rate'] = round(counts['attending_members'] / counts['members'], 4) \
+            if counts['members'] else None
+        return counts
+
+    @staticmethod
+    def build(start, end, event_id=None):
+        """Computes the participation of every segment between start and end
+
+        :return: One entry per combination of segment values holding the
+                 number of members, of members with a record in the window,
+                 of records and of present records, the same counts summed
+                 per single segment and overall, and the participation rate
+                 (attending members over members) of each
+        """
+        age_band = ParticipationReportService._age_band(end)
+        joined = [Attendance.member_id == Member.id, Attendance.date.between(start, end)]
+        if event_id:
+            joined.append(Attendance.event_id == event_id)
+        keys = [Member.gender, Member.marital_status, age_band, Member.status]
+        stmt = select(
+            *keys, func.count(func.distinct(Member.id)), func.count(func.distinct(Attendance.member_id)),
+            func.count(Attendance.id), func.sum(case((func.upper(Attendance.status) == 'PRESENT', 1), else_=0)),
+        ).select_from(Member).outerjoin(Attendance, and_(*joined)).group_by(*keys)
+
+        segments = [dict(zip(SEGMENTS + COUNTS, row[:4] + tuple(int(value or 0) for value in row[4:])))
+                    for row in storage.reader().execute(stmt)]
+
+        # Each member falls in exactly one segment, so the counts add up
+        by = {name: {} for name in SEGMENTS}
+        totals = dict.fromkeys(COUNTS, 0)
+        for segment in segments:
+            for name in SEGMENTS:
+                counts = by[name].setdefault(segment[name], dict.fromkeys(COUNTS, 0))
+                for count in COUNTS:
+                    counts[count] += segment[count]
+            for count in COUNTS:
+                totals[count] += segment[count]
+
+        return {
+            'start_date': start.isoformat(), 'end_date': end.isoformat(), 'event_id': event_id,
+            'segments': [ParticipationReportService._rate(segment) for segment in segments],
+            'by': {name: [ParticipationReportService._rate(dict(value=value, **counts))
+                          for value, counts in sorted(values.items(), key=lambda item: str(item[0]))]
+                   for name, values in by.items()},
+            'totals': ParticipationReportService._rate(totals),
+        }
+
+    @staticmethod
+    def report(start_date=None, end_date=None, event_id=None):
+        """Returns the participation report of [start_date, end_date] (the
+        last year up to today by default), cached until an attendance record
+        or a member is written.
+        Raises ValueError for a malformed date or an inverted range."""
+        try:
+            end = date.fromisoformat(end_date) if end_date else date.today()
+            start = date.fromisoformat(start_date) if start_date else end - timedelta(days=364)
+        except (TypeError, ValueError):
+            raise ValueError("start_date and end_date must be formatted as YYYY-MM-DD")
+        if start > end:
+            raise ValueError("start_date must not be after end_date")
+
+        params = {'start_date': start.isoformat(), 'end_date': end.isoformat(), 'event_id': event_id}
+        return cache.get_or_set('participation_report', params,
+                                lambda: ParticipationReportService.build(start, end, event_id),
+                                depends_on=['Attendance', 'Member'])
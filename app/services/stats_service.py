@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Computes membership statistics with Core queries"""
+from sqlalchemy import case, func, select
+
+from app.models import storage
+from app.models.association_tables import member_department, member_group
+from app.models.department import Department
+from app.models.group import Group
+from app.models.member import Member
+
+
+class StatsService:
+    """Counts members straight from the association tables: one grouped
+    query per table returns the figures of every department or group at
+    once, as plain rows, without building ORM objects"""
+
+    @staticmethod
+    def _distribution(cls, link, key):
+        """Returns the members, active and inactive counts of every `cls` row
+        (inactive covers every status other than 'active')"""
+        active = func.sum(case((func.lower(Member.status) == 'active', 1), else_=0))
+        stmt = select(cls.id, cls.name, func.count(Member.id), active).select_from(cls) \
+            .outerjoin(link, link.c[key] == cls.id).outerjoin(Member, Member.id == link.c.member_id) \
+            .group_by(cls.id, cls.name).order_by(cls.name, cls.id)
+        return [{'id': id, 'name': name, 'members': members, 'active': int(active or 0),
+                 'inactive': members - int(active or 0)}
+                for id, name, members, active in storage.reader().execute(stmt)]
+
+    @staticmethod
+    def distribution():
+        """Returns the member counts, split into active and inactive, of
+        every department, every group and the whole membership"""
+        statuses = select(func.lower(Member.status), func.count()).group_by(func.lower(Member.status))
+        by_status = dict(storage.reader().execute(statuses).all())
+        total = sum(by_status.values())
+        return {
+            'members': {'members': total, 'active': by_status.get('active', 0),
+                        'inactive': total - by_status.get('active', 0), 'by_status': by_status},
+            'departments': StatsService._distribution(Department, member_department, 'department_id'),
+            'groups': StatsService._distribution(Group, member_group, 'group_id'),
+        }
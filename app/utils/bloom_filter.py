@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+"""Utility for a Bloom filter: a compact set answering "definitely not present" """
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Set of strings with no false negatives and a bounded rate of false
+    positives. Items cannot be removed.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Sizes the filter for `capacity` items at the given false-positive rate.
+        :param capacity: Expected number of items
+        :param error_rate: Acceptable probability that an absent item is reported present
+        """
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.count = 0
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __positions(self, item):
+        """Yields the bit positions of an item (double hashing of one digest)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item):
+        """Adds an item"""
+        for position in self.__positions(item):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        """Returns False if the item was never added, True if it may have been"""
+        return all(self.__bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(item))
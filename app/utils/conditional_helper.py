@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+"""Utility for conditional GET (ETag) on collection endpoints"""
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from flask import make_response, request
+from app.models import storage, cache
+
+
+def collection_version(cls):
+    """
+    Returns the version of a collection as (last modified, row count).
+    It is kept in the shared cache until a write to `cls` is committed, so
+    revalidating an unchanged collection usually costs no query at all.
+    :param cls: Model class of the collection
+    """
+    def produce():
+        updated_at, total = storage.version(cls)
+        return [updated_at, total]
+
+    updated_at, total = cache.get_or_set('collection_version', {'cls': cls.__name__}, produce,
+                                         depends_on=[cls.__name__])
+    if updated_at:
+        # updated_at is naive local time, as written by BaseModel
+        updated_at = datetime.fromisoformat(updated_at).astimezone(timezone.utc)
+    return updated_at, total
+
+
+def conditional_get(cls):
+    """
+    Decorator answering GET requests for a collection with 304 Not Modified
+    when the client's ETag is still current, without running the view.
+    Other responses get an ETag header. No Last-Modified is sent: deleting
+    a row other than the newest leaves the latest updated_at unchanged, so
+    only the ETag, which also covers the row count, can tell.
+    :param cls: Model class listed by the route
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            updated_at, total = collection_version(cls)
+            # The query string (cursor, limit, filters) selects the page, so it is part of the tag
+            seed = f"{cls.__name__}:{updated_at}:{total}:{request.query_string.decode()}"
+            etag = hashlib.sha1(seed.encode()).hexdigest()
+
+            not_modified = request.if_none_match.contains_weak(etag)
+            response = make_response(('', 304) if not_modified else func(*args, **kwargs))
+            if response.status_code in (200, 304):
+                response.set_etag(etag, weak=True)
+                response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""Utility for keyset (cursor) pagination of list endpoints"""
+from flask import jsonify, request, url_for, current_app
+from app.models import storage
+from app.schemas.serializers import serializer_for
+
+
+def get_limit():
+    """
+    Reads the `limit` query parameter, bounded by the configured maximum.
+    :return: The page size to use for this request
+    """
+    limit = request.args.get('limit', current_app.config['PAGE_SIZE'])
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be greater than 0")
+    return min(limit, current_app.config['MAX_PAGE_SIZE'])
+
+
+def link_next(response, limit, next_cursor):
+    """
+    Announces the next page of a keyset-paginated response through a
+    `Link: <...>; rel="next"` header and an `X-Next-Cursor` header.
+    :param response: Response holding the current page
+    :param next_cursor: Cursor of the next page (None on the last page)
+    """
+    if next_cursor:
+        args = dict(request.args, **(request.view_args or {}))
+        args.update(limit=limit, cursor=next_cursor)
+        response.headers['Link'] = f'<{url_for(request.endpoint, **args)}>; rel="next"'
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+
+def paginate(cls, query=None, serialize=None):
+    """
+    Builds a JSON response holding one page of `cls` records.
+    The body stays a plain list; the next page is announced through a
+    `Link: <...>; rel="next"` header and an `X-Next-Cursor` header.
+    :param cls: Model class to page through
+    :param query: Optional query narrowing the records
+    :param serialize: Callable turning an object into a dict (defaults to the model serializer)
+    """
+    if serialize is None:
+        serialize = serializer_for(cls)
+
+    try:
+        limit = get_limit()
+        objects, next_cursor = storage.page(cls, limit, request.args.get('cursor'), query=query)
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+
+    return link_next(jsonify([serialize(obj) for obj in objects]), limit, next_cursor), 200
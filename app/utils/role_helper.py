@@ -9,6 +9,8 @@ def role_required(allowed_roles):
     Decorator to restrict access based on roles.
     :param allowed_roles: List of roles that can access the route
     """
+    allowed_roles = frozenset(allowed_roles)
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -18,4 +20,3 @@ def role_required(allowed_roles):
             return jsonify({"error": "Access forbidden: insufficient permissions"}), 403
         return wrapper
     return decorator
-
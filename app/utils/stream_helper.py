@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""Utility for streaming large result sets as a JSON array"""
+from flask import Response, request, current_app, stream_with_context
+
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_stream():
+    """
+    Checks whether the client asked for a streamed response (`?stream=true`).
+    :return: True if the response should be streamed
+    """
+    return request.args.get('stream', '').lower() in ['1', 'true', 'yes']
+
+
+def stream_json(query, serialize=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Streams the rows of a query as a JSON array.
+    Rows are pulled from the database `chunk_size` at a time with yield_per
+    and written out as soon as each chunk is encoded, so neither the result
+    set nor the JSON body is ever held in memory as a whole.
+    :param query: SQLAlchemy query to stream
+    :param serialize: Callable turning a row into a dict (defaults to to_dict)
+    :param chunk_size: Number of rows fetched and written per chunk
+    """
+    if serialize is None:
+        serialize = lambda obj: obj.to_dict()
+
+    def generate():
+        dumps = current_app.json.dumps
+        separator = ''
+        chunk = []
+        yield '['
+        for row in query.yield_per(chunk_size):
+            chunk.append(dumps(serialize(row)))
+            if len(chunk) == chunk_size:
+                yield separator + ','.join(chunk)
+                separator = ','
+                chunk = []
+        if chunk:
+            yield separator + ','.join(chunk)
+        yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""Utility warming the process caches of a new worker within a time budget"""
+import threading
+import time
+from datetime import date, timedelta
+
+from app.models import storage, unique_index
+from app.models.department import Department
+from app.models.event import Event
+from app.models.group import Group
+
+
+class Warmup:
+    """
+    Runs the warm-up steps in order in a background thread and records
+    their progress. Steps still pending when the budget runs out are
+    skipped; the worker is ready once every step has finished or been
+    skipped, so a slow database delays traffic by at most the budget.
+    """
+
+    def __init__(self, app):
+        """
+        Prepares the steps for an application.
+        :param app: Flask application whose config holds WARMUP_BUDGET and WARMUP_EVENT_DAYS
+        """
+        self.app = app
+        self.budget = app.config['WARMUP_BUDGET']
+        self.steps = [
+            ('departments', lambda: storage.preload(Department)),
+            ('groups', lambda: storage.preload(Group)),
+            ('upcoming_events', self.upcoming_events),
+            ('unique_index', self.unique_index),
+            ('counts', lambda: len(storage.counts())),
+        ]
+        self.progress = {name: {'state': 'pending'} for name, _ in self.steps}
+        self.started_at = self.finished_at = None
+        self.done = threading.Event()
+
+    def upcoming_events(self):
+        """Caches the events starting within WARMUP_EVENT_DAYS"""
+        today = date.today()
+        return storage.preload(Event, Event.start_date.between(
+            today, today + timedelta(days=self.app.config['WARMUP_EVENT_DAYS'])))
+
+    def unique_index(self):
+        """Loads the username/email Bloom filters"""
+        unique_index.build()
+        return None
+
+    def run(self):
+        """Runs the steps until done or out of budget"""
+        self.started_at = time.monotonic()
+        deadline = self.started_at + self.budget
+        try:
+            for name, step in self.steps:
+                if time.monotonic() >= deadline:
+                    self.progress[name] = {'state': 'skipped'}
+                    continue
+                started = time.monotonic()
+                try:
+                    loaded = step()
+                    self.progress[name] = {'state': 'done'}
+                    if loaded is not None:
+                        self.progress[name]['loaded'] = loaded
+                except Exception as err:
+                    # The caches fill on demand anyway; a failed step must not keep the worker unready
+                    self.app.logger.warning("Warm-up step %s failed: %s", name, err)
+                    self.progress[name] = {'state': 'failed', 'error': str(err)}
+                finally:
+                    self.progress[name]['ms'] = round((time.monotonic() - started) * 1000, 1)
+                    storage.close()
+        finally:
+            self.finished_at = time.monotonic()
+            self.done.set()
+
+    def start(self):
+        """Starts the warm-up in a daemon thread"""
+        threading.Thread(target=self.run, name='warmup', daemon=True).start()
+
+    @property
+    def ready(self):
+        """True once every step has finished, failed or been skipped, or
+        once the budget is spent even if a step is still running"""
+        return self.done.is_set() or (
+            self.started_at is not None and time.monotonic() - self.started_at >= self.budget)
+
+    def status(self):
+        """Returns the readiness and per-step progress"""
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round(((self.finished_at or time.monotonic()) - self.started_at) * 1000, 1)
+        return {'ready': self.ready, 'budget_s': self.budget, 'elapsed_ms': elapsed, 'steps': self.progress}
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Benchmarks the compiled model serializers against the former to_dict
+
+Runs on an in-memory SQLite database:
+    python -m benchmarks.bench_serializers [rows]
+"""
+import json
+import os
+import sys
+import timeit
+from datetime import date, datetime, time
+
+os.environ.setdefault("FaithConnectHub_DATABASE_URL", "sqlite://")
+
+from flask.json.provider import _default  # noqa: E402
+from app.models import storage  # noqa: E402
+from app.models.attendance import Attendance  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.member import Member  # noqa: E402
+from app.schemas.serializers import serializer_for  # noqa: E402
+
+
+def legacy_to_dict(obj):
+    """BaseModel.to_dict as it was: scans __dict__, leaves values raw"""
+    a_dict = {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+    a_dict['__class__'] = type(obj).__name__
+    return a_dict
+
+
+def legacy_json_ready(obj):
+    """The former to_dict plus the per-value conversion routes had to do"""
+    a_dict = legacy_to_dict(obj)
+    for key, value in a_dict.items():
+        if isinstance(value, datetime):
+            a_dict[key] = value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+        elif isinstance(value, (date, time)):
+            a_dict[key] = value.isoformat()
+    return a_dict
+
+
+def populate(rows):
+    """Stores `rows` members and events and as many attendance records"""
+    event = Event(name="Service", start_date=date(2024, 1, 7), end_date=date(2024, 1, 7),
+                  start_time=time(9), end_time=time(11), location="Main hall",
+                  description="Sunday service", category="Service")
+    members = [Member(first_name=f"First{i}", last_name="Last", email=f"member{i}@example.com",
+                      phone_number="0240000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                      gender="female", marital_status="single") for i in range(rows)]
+    storage.bulk_new([event] + members)
+    storage.save()
+    storage.bulk_new([Attendance(member_id=member.id, event_id=event.id, status="Present",
+                                 date=date(2024, 1, 7)) for member in members])
+    storage.save()
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<42}{seconds * 1000:9.3f} ms")
+    return seconds
+
+
+def main(rows=2000):
+    populate(rows)
+    for cls in (Member, Attendance):
+        objs = storage.query(cls).all()
+        serialize = serializer_for(cls)
+        print(f"\n{cls.__name__}: {len(objs)} objects")
+        bench("legacy to_dict (raw values)", lambda: [legacy_to_dict(o) for o in objs], 20)
+        legacy = bench("legacy to_dict + conversion", lambda: [legacy_json_ready(o) for o in objs], 20)
+        compiled = bench("compiled serializer", lambda: serialize.many(objs), 20)
+        legacy_json = bench("legacy to_dict + json.dumps",
+                            lambda: json.dumps([legacy_to_dict(o) for o in objs], default=_default), 10)
+        compiled_json = bench("compiled serializer + json.dumps", lambda: json.dumps(serialize.many(objs)), 10)
+        print(f"speed-up: {legacy / compiled:.1f}x JSON-ready dicts, {legacy_json / compiled_json:.1f}x JSON")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -21,18 +21,67 @@ import os
 load_dotenv()
 
 class Config:
+    # Deployment environment: 'dev' or 'test' enable development conveniences
+    ENV = os.getenv("FaithConnectHub_ENV", "production")
+
     # Database Configuration
     user = os.getenv("FaithConnectHub_USER")
     pwd = os.getenv("FaithConnectHub_PWD")
     host = os.getenv("FaithConnectHub_HOST")
     db = os.getenv("FaithConnectHub_DB")
 
-    # Database connection string
-    SQLALCHEMY_DATABASE_URI = f'mysql+mysqldb://{user}:{pwd}@{host}/{db}'
+    # Database connection string (FaithConnectHub_DATABASE_URL overrides the MySQL settings)
+    SQLALCHEMY_DATABASE_URI = os.getenv("FaithConnectHub_DATABASE_URL") or f'mysql+mysqldb://{user}:{pwd}@{host}/{db}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Optional read replica; list, report and lookup reads are sent there when it is healthy
+    SQLALCHEMY_REPLICA_URI = os.getenv("FaithConnectHub_REPLICA_URL")
+    REPLICA_HEALTH_INTERVAL = int(os.getenv("FaithConnectHub_REPLICA_HEALTH_INTERVAL", 30))  # seconds
+
+    # Create missing tables at startup; set to 0 when the schema is managed by Alembic
+    AUTO_CREATE_SCHEMA = os.getenv("FaithConnectHub_AUTO_CREATE_SCHEMA", "1") == "1"
+
+    # Connection pool settings
+    DB_POOL_SIZE = int(os.getenv("FaithConnectHub_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("FaithConnectHub_MAX_OVERFLOW", 20))
+    DB_POOL_RECYCLE = int(os.getenv("FaithConnectHub_POOL_RECYCLE", 1800))  # seconds
+    DB_POOL_TIMEOUT = int(os.getenv("FaithConnectHub_POOL_TIMEOUT", 30))  # seconds
+    DB_STATEMENT_TIMEOUT = int(os.getenv("FaithConnectHub_STATEMENT_TIMEOUT", 0))  # milliseconds, 0 disables
+
     # Flask-specific settings
     SECRET_KEY = os.getenv("SECRET_KEY")
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
     JWT_ACCESS_TOKEN_EXPIRES = 28800  # 8 hour
+
+    # Number of rows committed per transaction by storage.save_many
+    BULK_BATCH_SIZE = int(os.getenv("FaithConnectHub_BULK_BATCH_SIZE", 500))
+
+    # Seconds a cached table count is trusted before it is re-read from the database
+    COUNT_CACHE_TTL = int(os.getenv("FaithConnectHub_COUNT_CACHE_TTL", 300))
+
+    # In-process cache of rarely changing rows served by storage.get (size 0 disables it)
+    OBJECT_CACHE_SIZE = int(os.getenv("FaithConnectHub_OBJECT_CACHE_SIZE", 2048))
+    OBJECT_CACHE_TTLS = {'Department': 300, 'Group': 300, 'Event': 60}  # seconds, per class
+
+    # Shared cache for payloads and reports: Redis when REDIS_URL is set; otherwise
+    # in-process memory in dev/test and disabled elsewhere, as workers could serve stale copies
+    REDIS_URL = os.getenv("FaithConnectHub_REDIS_URL")
+    CACHE_NAMESPACE = os.getenv("FaithConnectHub_CACHE_NAMESPACE", "faithconnecthub")
+    CACHE_TTL = int(os.getenv("FaithConnectHub_CACHE_TTL", 300))  # seconds
+    # Attendance date-range results are invalidated per day, so they can live long
+    ATTENDANCE_RANGE_CACHE_TTL = int(os.getenv("FaithConnectHub_ATTENDANCE_RANGE_CACHE_TTL", 86400))  # seconds
+    ATTENDANCE_RANGE_CACHE_MAX_DAYS = int(os.getenv("FaithConnectHub_ATTENDANCE_RANGE_CACHE_MAX_DAYS", 366))
+
+    # Bloom filters pre-checking usernames/emails for duplicates before querying
+    UNIQUE_INDEX_CAPACITY = int(os.getenv("FaithConnectHub_UNIQUE_INDEX_CAPACITY", 100000))
+    UNIQUE_INDEX_ERROR_RATE = float(os.getenv("FaithConnectHub_UNIQUE_INDEX_ERROR_RATE", 0.01))
+
+    # Startup warm-up of the process caches; /ready reports 503 until it ends
+    WARMUP_ENABLED = os.getenv("FaithConnectHub_WARMUP", "1") == "1"
+    WARMUP_BUDGET = float(os.getenv("FaithConnectHub_WARMUP_BUDGET", 10))  # seconds
+    WARMUP_EVENT_DAYS = int(os.getenv("FaithConnectHub_WARMUP_EVENT_DAYS", 30))  # upcoming events to preload
+
+    # Pagination settings for list endpoints
+    PAGE_SIZE = int(os.getenv("FaithConnectHub_PAGE_SIZE", 100))
+    MAX_PAGE_SIZE = int(os.getenv("FaithConnectHub_MAX_PAGE_SIZE", 1000))
     DEBUG = True
@@ -1,3 +1,5 @@
+import os
+import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,6 +7,16 @@ from sqlalchemy import pool
 
 from alembic import context
 
+# Make the project importable and keep storage from creating tables itself:
+# the schema is owned by the revisions in migrations/versions
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["FaithConnectHub_AUTO_CREATE_SCHEMA"] = "0"
+
+from config import Config  # noqa: E402
+from app.models.base_model import Base  # noqa: E402
+import app.models.association_tables  # noqa: E402,F401
+from app.schemas.db_storage import classes  # noqa: E402,F401  (registers every model)
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -14,11 +26,13 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Use the application's database unless a URL was given explicitly
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", Config.SQLALCHEMY_DATABASE_URI.replace("%", "%%"))
+
 # add your model's MetaData object here
 # for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
+target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
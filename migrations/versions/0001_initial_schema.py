@@ -0,0 +1,166 @@
+"""initial schema
+
+Tables as originally created by Base.metadata.create_all. Databases that
+already have them should be stamped with `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 11:32:41.254058
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # members, departments and groups reference each other, so the members
+    # foreign keys to departments and groups are added once those tables exist
+    op.create_table('members',
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('phone_number', sa.String(length=20), nullable=False),
+    sa.Column('address', sa.String(length=120), nullable=False),
+    sa.Column('date_of_birth', sa.DateTime(), nullable=False),
+    sa.Column('gender', sa.String(length=10), nullable=False),
+    sa.Column('marital_status', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('date_joined', sa.Date(), nullable=False),
+    sa.Column('department_id', sa.String(length=60), nullable=True),
+    sa.Column('group_id', sa.String(length=60), nullable=True),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    op.create_table('departments',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=False),
+    sa.Column('leader_id', sa.String(length=60), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['leader_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('groups',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=False),
+    sa.Column('leader_id', sa.String(length=60), nullable=False),
+    sa.Column('department_id', sa.String(length=60), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['leader_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('members') as batch_op:
+        batch_op.create_foreign_key('fk_members_department_id_departments', 'departments',
+                                    ['department_id'], ['id'])
+        batch_op.create_foreign_key('fk_members_group_id_groups', 'groups', ['group_id'], ['id'])
+    op.create_table('events',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('department_id', sa.String(length=60), nullable=True),
+    sa.Column('group_id', sa.String(length=60), nullable=True),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('member_department',
+    sa.Column('member_id', sa.String(length=60), nullable=False),
+    sa.Column('department_id', sa.String(length=60), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('member_id', 'department_id')
+    )
+    op.create_table('member_group',
+    sa.Column('member_id', sa.String(length=60), nullable=False),
+    sa.Column('group_id', sa.String(length=60), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('member_id', 'group_id')
+    )
+    op.create_table('users',
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('member_id', sa.String(length=60), nullable=True),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email'),
+    sa.UniqueConstraint('username')
+    )
+    op.create_table('attendance',
+    sa.Column('member_id', sa.String(length=60), nullable=True),
+    sa.Column('event_id', sa.String(length=60), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('remarks', sa.Text(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('is_guest', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('financial_records',
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('donor', sa.String(length=100), nullable=True),
+    sa.Column('event_id', sa.String(length=60), nullable=True),
+    sa.Column('department_id', sa.String(length=60), nullable=True),
+    sa.Column('group_id', sa.String(length=60), nullable=True),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('financial_records')
+    op.drop_table('attendance')
+    op.drop_table('users')
+    op.drop_table('member_group')
+    op.drop_table('member_department')
+    op.drop_table('events')
+    with op.batch_alter_table('members') as batch_op:
+        batch_op.drop_constraint('fk_members_group_id_groups', type_='foreignkey')
+        batch_op.drop_constraint('fk_members_department_id_departments', type_='foreignkey')
+    op.drop_table('groups')
+    op.drop_table('departments')
+    op.drop_table('members')
@@ -0,0 +1,47 @@
+"""hot query indexes
+
+Composite indexes for the attendance date-range filters, finance reports,
+member status/role filters and keyset pagination on (created_at, id).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 11:40:12.602114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_attendance_event_id_date', 'attendance', ['event_id', 'date'], unique=False)
+    op.create_index('ix_attendance_member_id_date', 'attendance', ['member_id', 'date'], unique=False)
+    op.create_index('ix_attendance_date_status', 'attendance', ['date', 'status'], unique=False)
+    op.create_index('ix_attendance_created_at_id', 'attendance', ['created_at', 'id'], unique=False)
+    op.create_index('ix_financial_records_date_category_type', 'financial_records',
+                    ['date', 'category', 'type'], unique=False)
+    op.create_index('ix_financial_records_department_id_date', 'financial_records',
+                    ['department_id', 'date'], unique=False)
+    op.create_index('ix_financial_records_created_at_id', 'financial_records', ['created_at', 'id'], unique=False)
+    op.create_index('ix_members_status_role', 'members', ['status', 'role'], unique=False)
+    op.create_index('ix_members_created_at_id', 'members', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_members_created_at_id', table_name='members')
+    op.drop_index('ix_members_status_role', table_name='members')
+    op.drop_index('ix_financial_records_created_at_id', table_name='financial_records')
+    op.drop_index('ix_financial_records_department_id_date', table_name='financial_records')
+    op.drop_index('ix_financial_records_date_category_type', table_name='financial_records')
+    op.drop_index('ix_attendance_created_at_id', table_name='attendance')
+    op.drop_index('ix_attendance_date_status', table_name='attendance')
+    op.drop_index('ix_attendance_member_id_date', table_name='attendance')
+    op.drop_index('ix_attendance_event_id_date', table_name='attendance')
@@ -0,0 +1,44 @@
+"""financial summaries
+
+Monthly totals maintained by FinanceService. Fill the table for existing
+records with `flask --app wsgi rebuild-finance-summary`.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:52:06.318420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('financial_summaries',
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('department_id', sa.String(length=60), nullable=False),
+    sa.Column('group_id', sa.String(length=60), nullable=False),
+    sa.Column('total', sa.Float(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ux_financial_summaries_key', 'financial_summaries',
+                    ['period', 'type', 'category', 'department_id', 'group_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_financial_summaries_key', table_name='financial_summaries')
+    op.drop_table('financial_summaries')
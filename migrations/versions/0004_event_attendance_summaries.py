@@ -0,0 +1,42 @@
+"""event attendance summaries
+
+Per-event turnout maintained by AttendanceService. Fill the table for
+existing records with `flask --app wsgi rebuild-attendance-summary`.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:03:44.512907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('event_attendance_summaries',
+    sa.Column('event_id', sa.String(length=60), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('present', sa.Integer(), nullable=False),
+    sa.Column('absent', sa.Integer(), nullable=False),
+    sa.Column('guests', sa.Integer(), nullable=False),
+    sa.Column('first_timers', sa.Integer(), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('event_attendance_summaries')
@@ -0,0 +1,28 @@
+"""events category index
+
+Index for the attendance trends grouped and filtered by event category.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 13:10:27.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_category', 'events', ['category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_category', table_name='events')
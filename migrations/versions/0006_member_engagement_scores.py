@@ -0,0 +1,47 @@
+"""member engagement scores
+
+Engagement score and rank per member, recomputed by
+`flask --app wsgi compute-engagement-scores`.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 13:42:08.914263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('member_engagement_scores',
+    sa.Column('member_id', sa.String(length=60), nullable=False),
+    sa.Column('as_of', sa.Date(), nullable=False),
+    sa.Column('last_attended', sa.Date(), nullable=True),
+    sa.Column('attended_4w', sa.Integer(), nullable=False),
+    sa.Column('attended_13w', sa.Integer(), nullable=False),
+    sa.Column('attended_52w', sa.Integer(), nullable=False),
+    sa.Column('memberships', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('id', sa.String(length=60), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['member_id'], ['members.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('member_id')
+    )
+    op.create_index('ux_member_engagement_scores_rank', 'member_engagement_scores', ['rank'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_member_engagement_scores_rank', table_name='member_engagement_scores')
+    op.drop_table('member_engagement_scores')
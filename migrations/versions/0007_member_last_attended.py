@@ -0,0 +1,35 @@
+"""member last attended
+
+Last attendance date and attendance count per member, maintained by
+AttendanceService. Fill them for existing records with
+`flask --app wsgi backfill-member-attendance`.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 14:21:53.640172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('members', sa.Column('last_attended_at', sa.Date(), nullable=True))
+    op.add_column('members', sa.Column('attendance_count', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index('ix_members_status_last_attended_at', 'members', ['status', 'last_attended_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_members_status_last_attended_at', table_name='members')
+    with op.batch_alter_table('members') as batch_op:
+        batch_op.drop_column('attendance_count')
+        batch_op.drop_column('last_attended_at')
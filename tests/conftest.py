@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Test configuration: the suite runs against a throwaway SQLite database
+(with foreign keys enforced, as on MySQL) unless
+FaithConnectHub_DATABASE_URL points elsewhere"""
+import os
+import sqlite3
+import tempfile
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+os.environ.setdefault('FaithConnectHub_DATABASE_URL',
+                      'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'faithconnecthub.db'))
+os.environ.setdefault('FaithConnectHub_WARMUP', '0')
+
+
+@event.listens_for(Engine, 'connect')
+def enforce_foreign_keys(dbapi_connection, connection_record):
+    """Turns on SQLite foreign key checks for every new connection"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+
+@pytest.fixture
+def clean_storage():
+    """Empties every table and the shared cache around a test"""
+    from app.models import storage, cache
+    from app.models.base_model import Base
+
+    def empty():
+        storage.close()
+        session = storage.session
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
+        storage.close()
+        cache.backend.flushdb()
+
+    empty()
+    yield storage
+    empty()
+
+
+@pytest.fixture
+def make_client(clean_storage):
+    """Returns a factory of test clients authenticated with a given role"""
+    from flask_jwt_extended import create_access_token
+    from wsgi import create_app
+
+    app = create_app()
+    app.config.update(TESTING=True, JWT_SECRET_KEY='test-jwt-secret-key-0123456789abcdef')
+
+    def make(role='ADMIN'):
+        with app.app_context():
+            token = create_access_token(identity={"id": "test-user", "role": role})
+        client = app.test_client()
+        client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+        return client
+    return make
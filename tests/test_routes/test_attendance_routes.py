@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""Integration tests for the attendance routes"""
+import unittest
+from datetime import date, datetime, time
+
+import pytest
+
+from app.models import storage
+from app.models.attendance import Attendance
+from app.models.event import Event
+from app.models.member import Member
+
+
+def make_event(n, **kwargs):
+    """Returns a saved event"""
+    values = dict(name=f"Service {n}", start_date=date(2026, 1, 4), end_date=date(2026, 1, 4),
+                  start_time=time(9), end_time=time(11), location="Main Sanctuary",
+                  description="Sunday service", category="Service")
+    values.update(kwargs)
+    event = Event(**values)
+    event.save()
+    return event
+
+
+def make_member(n, **kwargs):
+    """Returns a saved member"""
+    values = dict(first_name=f"First{n}", last_name="Last", email=f"member{n}@example.com",
+                  phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                  gender="Female", marital_status="Single")
+    values.update(kwargs)
+    member = Member(**values)
+    member.save()
+    return member
+
+
+class TestAttendanceBatch(unittest.TestCase):
+    """Test cases for POST /resources/attendance/batch"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_client(self, make_client):
+        """Creates an admin client, an event and two members"""
+        self.client = make_client('ADMIN')
+        self.event_id = make_event(1).id
+        self.member_ids = [make_member(n).id for n in range(2)]
+        storage.close()
+
+    def post(self, **payload):
+        """Posts a batch for the test event"""
+        return self.client.post('/resources/attendance/batch', json=dict(event_id=self.event_id, **payload))
+
+    def test_checks_in_members_and_guests(self):
+        """Members and guests are recorded; unknown and repeated members are reported"""
+        response = self.post(member_ids=self.member_ids + ['missing', self.member_ids[0]],
+                             guests=[{'remarks': 'Visitor'}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json['created'], 3)
+        self.assertEqual([result['result'] for result in response.json['results']],
+                         ['created', 'created', 'not_found', 'already_recorded', 'created'])
+        self.assertEqual(storage.query(Attendance).filter_by(event_id=self.event_id).count(), 3)
+
+        response = self.post(member_ids=self.member_ids[:1])
+        self.assertEqual(response.json['results'][0]['result'], 'already_recorded')
+
+    def test_unknown_event(self):
+        """An unknown event is a 404"""
+        response = self.client.post('/resources/attendance/batch', json={'event_id': 'missing'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_guest_must_be_an_object(self):
+        """A guest given as a string is a 400 naming its index, and nothing is written"""
+        response = self.post(member_ids=self.member_ids, guests=[{'remarks': 'Visitor'}, "Jane"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json, {"error": "guests[1] must be an object"})
+        self.assertEqual(storage.query(Attendance).count(), 0)
+
+    def test_member_id_must_be_a_string(self):
+        """A member id that is not a string is a 400 naming its index, and nothing is written"""
+        response = self.post(member_ids=[self.member_ids[0], {'id': self.member_ids[1]}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json, {"error": "member_ids[1] must be a string"})
+        self.assertEqual(storage.query(Attendance).count(), 0)
+
+    def test_lists_required(self):
+        """member_ids and guests must be lists"""
+        self.assertEqual(self.post(member_ids='abc').status_code, 400)
+
+    def test_invalid_status(self):
+        """Only PRESENT and ABSENT are accepted"""
+        self.assertEqual(self.post(member_ids=self.member_ids, status='LATE').status_code, 400)
+
+
+class TestAttendanceDateRange(unittest.TestCase):
+    """Test cases for GET /resources/attendance/date"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_client(self, make_client):
+        """Creates a pastor client and a record dated 2026-01-04"""
+        self.client = make_client('PASTOR')
+        Attendance(event_id=make_event(1).id, member_id=make_member(1).id, status='PRESENT',
+                   date=date(2026, 1, 4)).save()
+        storage.close()
+
+    def get(self, query='', **payload):
+        """Requests the records of a date range"""
+        return self.client.get(f'/resources/attendance/date{query}', json=payload)
+
+    def test_cached_and_streamed_agree(self):
+        """Both branches return the records of the range"""
+        for query in ('', '?stream=true'):
+            response = self.get(query, start_date='2026-01-01', end_date='2026-01-31')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([record['date'] for record in response.json], ['2026-01-04'])
+
+    def test_invalid_dates(self):
+        """Malformed or missing dates are a 400 on both branches"""
+        for query in ('', '?stream=true'):
+            for payload in ({'start_date': '2026-13-01', 'end_date': '2026-01-31'},
+                            {'start_date': 20260101, 'end_date': '2026-01-31'},
+                            {'start_date': '2026-01-01'}):
+                response = self.get(query, **payload)
+                self.assertEqual(response.status_code, 400, (query, payload))
+
+
+if __name__ == '__main__':
+    unittest.main()
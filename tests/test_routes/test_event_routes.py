@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+"""Integration tests for the event routes"""
+import unittest
+from datetime import date, time
+
+import pytest
+
+from app.models import storage
+from app.models.event import Event
+
+
+class TestListEvents(unittest.TestCase):
+    """Test cases for conditional GET /resources/events"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_client(self, make_client):
+        """Creates a member client and two events"""
+        self.client = make_client('MEMBER')
+        self.ids = []
+        for n in range(2):
+            event = Event(name=f"Service {n}", start_date=date(2026, 1, 4), end_date=date(2026, 1, 4),
+                          start_time=time(9), end_time=time(11), location="Main Sanctuary",
+                          description="Sunday service", category="Service")
+            event.save()
+            self.ids.append(event.id)
+        storage.close()
+
+    def test_not_modified(self):
+        """A current ETag gets a 304; there is no Last-Modified to revalidate with"""
+        response = self.client.get('/resources/events')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.last_modified)
+        response = self.client.get('/resources/events', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    def test_deleting_an_older_row_changes_the_version(self):
+        """Deleting a row other than the newest is seen by both kinds of revalidation"""
+        etag = self.client.get('/resources/events').headers['ETag']
+        storage.delete(storage.get(Event, self.ids[0]))
+        storage.save()
+        storage.close()
+        response = self.client.get('/resources/events', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get('/resources/events', headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
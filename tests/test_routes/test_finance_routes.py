@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""Integration tests for the finance routes"""
+import unittest
+
+import pytest
+
+from app.models import storage
+from app.models.finance import FinancialRecord
+from app.services.finance_service import FinanceService
+
+
+class TestFinanceRecords(unittest.TestCase):
+    """Test cases for POST and PUT /resources/finance"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_client(self, make_client):
+        """Creates an admin client"""
+        self.client = make_client('ADMIN')
+
+    def create(self, **payload):
+        """Posts a record"""
+        return self.client.post('/resources/finance', json=dict(
+            type="Income", description="Sunday offering", category="offering", **payload))
+
+    def test_amount_defaults_to_zero(self):
+        """A record without an amount is stored with 0.0"""
+        response = self.create()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json['amount'], 0.0)
+        self.assertEqual([(row['total'], row['count']) for row in FinanceService.summary()], [(0.0, 1)])
+
+    def test_invalid_amount(self):
+        """A non-numeric amount is a 400 and nothing is written"""
+        response = self.create(amount="abc")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json, {"error": "amount must be a number"})
+        self.assertEqual(storage.query(FinancialRecord).count(), 0)
+        self.assertEqual(FinanceService.summary(), [])
+
+    def test_update_rejects_before_writing(self):
+        """A malformed amount or date is a 400 naming the field, and leaves the record and summary as they were"""
+        record_id = self.create(amount=100).json['id']
+        storage.close()
+        for payload, error in (({'amount': "abc", 'category': "tithe"}, "amount must be a number"),
+                               ({'date': "2026-13-01", 'amount': 5}, "date must be formatted as YYYY-MM-DD")):
+            response = self.client.put(f'/resources/finance/{record_id}', json=payload)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json, {"error": error})
+            storage.close()
+            record = storage.get(FinancialRecord, record_id)
+            self.assertEqual((record.amount, record.category), (100.0, "offering"))
+            self.assertEqual([(row['category'], row['total']) for row in FinanceService.summary()],
+                             [("offering", 100.0)])
+
+        response = self.client.put(f'/resources/finance/{record_id}', json={'amount': "12.5"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['total'] for row in FinanceService.summary()], [12.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+"""Integration tests for the member routes"""
+import unittest
+from datetime import date, datetime
+
+import pytest
+
+from app.models import storage
+from app.models.engagement_score import MemberEngagementScore
+from app.models.member import Member
+from app.services.engagement_service import EngagementService
+
+
+class TestDeleteMember(unittest.TestCase):
+    """Test cases for DELETE /resources/members/<member_id>"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_client(self, make_client):
+        """Creates an admin client and a member"""
+        self.client = make_client('ADMIN')
+        member = Member(first_name="First", last_name="Last", email="member@example.com",
+                        phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                        gender="Female", marital_status="Single")
+        member.save()
+        self.member_id = member.id
+        storage.close()
+
+    def test_delete_scored_member(self):
+        """A member with an engagement score can be deleted, and the score goes with them"""
+        EngagementService.compute(date(2026, 1, 31))
+        storage.close()
+        response = self.client.delete(f'/resources/members/{self.member_id}')
+        self.assertEqual(response.status_code, 200)
+        storage.close()
+        self.assertIsNone(storage.get(Member, self.member_id))
+        self.assertEqual(storage.query(MemberEngagementScore).count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""Unit tests for CounterCache class"""
+import unittest
+from unittest.mock import patch
+
+from app.schemas.counter_cache import CounterCache
+
+
+class Record:
+    """Plain object standing in for a model instance"""
+
+    def __init__(self, status):
+        self.status = status
+
+
+class TestCounterCache(unittest.TestCase):
+    """Test cases for CounterCache class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.cache = CounterCache(ttl=60)
+        self.all_key = CounterCache.key('Record')
+        self.active_key = CounterCache.key('Record', {'status': 'active'})
+        self.cache.set(self.all_key, Record, 10)
+        self.cache.set(self.active_key, Record, 4)
+
+    def test_missing_key(self):
+        """Test unknown counts are reported as missing"""
+        self.assertIsNone(self.cache.get(CounterCache.key('Other')))
+
+    def test_insert_and_delete(self):
+        """Test inserts and deletes adjust matching counters"""
+        self.cache.apply([('new', Record('active'), {}), ('new', Record('inactive'), {}),
+                          ('deleted', Record('inactive'), {})])
+        self.assertEqual(self.cache.get(self.all_key), 11)
+        self.assertEqual(self.cache.get(self.active_key), 5)
+
+    def test_update_moves_between_filters(self):
+        """Test an update uses the previous values to adjust filtered counters"""
+        self.cache.apply([('dirty', Record('inactive'), {'status': 'active'})])
+        self.assertEqual(self.cache.get(self.all_key), 10)
+        self.assertEqual(self.cache.get(self.active_key), 3)
+
+    def test_other_classes_ignored(self):
+        """Test writes of other classes leave the counters alone"""
+        self.cache.apply([('new', object(), {})])
+        self.assertEqual(self.cache.get(self.all_key), 10)
+
+    def test_expired_counts(self):
+        """Test counts older than the ttl must be reconciled"""
+        with patch('app.schemas.counter_cache.time.monotonic', return_value=10 ** 9):
+            self.assertIsNone(self.cache.get(self.all_key))
+
+
+if __name__ == '__main__':
+    unittest.main()
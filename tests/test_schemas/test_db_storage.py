@@ -0,0 +1,253 @@
+#!/usr/bin/python3
+"""Unit tests for DBStorage against a SQLite database"""
+import unittest
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app.models import storage
+from app.models.member import Member
+from app.schemas.db_storage import DBStorage
+from config import Config
+
+
+def make_member(n, **kwargs):
+    """Returns an unsaved member"""
+    values = dict(first_name=f"First{n}", last_name="Last", email=f"member{n}@example.com",
+                  phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                  gender="Female", marital_status="Single")
+    values.update(kwargs)
+    return Member(**values)
+
+
+class QueryCounter:
+    """Counts the statements sent through an engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self)
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestGet(unittest.TestCase):
+    """Test cases for DBStorage.get, get_many and get_each"""
+
+    def setUp(self):
+        """Saves three members"""
+        self.ids = storage.save_many([make_member(n) for n in range(3)])['saved']
+        storage.close()
+
+    def test_get(self):
+        """get accepts a class or its name and returns None when missing"""
+        self.assertEqual(storage.get(Member, self.ids[0]).id, self.ids[0])
+        self.assertEqual(storage.get('Member', self.ids[1]).id, self.ids[1])
+        self.assertIsNone(storage.get(Member, 'missing'))
+        self.assertIsNone(storage.get('Unknown', self.ids[0]))
+        self.assertIsNone(storage.get(Member, None))
+
+    def test_get_many_uses_one_query(self):
+        """get_many fetches the missing ids with a single IN query"""
+        with QueryCounter(storage.engine) as queries:
+            found = storage.get_many(Member, self.ids + ['missing', None])
+        self.assertEqual(set(found), set(self.ids))
+        self.assertEqual(queries.count, 1)
+
+    def test_get_many_serves_loaded_objects(self):
+        """Objects already in the session are not fetched again"""
+        loaded = storage.get_many(Member, self.ids)  # the identity map only holds weak references
+        with QueryCounter(storage.engine) as queries:
+            self.assertEqual(storage.get_many(Member, self.ids), loaded)
+        self.assertEqual(queries.count, 0)
+
+    def test_get_each_keeps_order(self):
+        """get_each returns one result per lookup, None where missing, in one query"""
+        with QueryCounter(storage.engine) as queries:
+            results = storage.get_each((Member, self.ids[2]), ('Member', 'missing'),
+                                       (Member, self.ids[0]), ('Unknown', self.ids[1]))
+        self.assertEqual([obj.id if obj else None for obj in results], [self.ids[2], None, self.ids[0], None])
+        self.assertEqual(queries.count, 1)
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestPage(unittest.TestCase):
+    """Test cases for DBStorage.page"""
+
+    def setUp(self):
+        """Saves members, several of them sharing a created_at"""
+        created = [datetime(2026, 1, 1), datetime(2026, 1, 2), datetime(2026, 1, 2), datetime(2026, 1, 2),
+                   datetime(2026, 1, 3)]
+        members = [make_member(n, created_at=at.strftime("%Y-%m-%dT%H:%M:%S.%f"), gender=['Male', 'Female'][n % 2])
+                   for n, at in enumerate(created)]
+        storage.save_many(members)
+        self.expected = [member.id for member in sorted(members, key=lambda member: (member.created_at, member.id))]
+        storage.close()
+
+    def collect(self, limit, query=None):
+        """Follows the cursors to the last page; returns the ids and page sizes"""
+        ids, sizes, cursor = [], [], None
+        while True:
+            objects, cursor = storage.page(Member, limit, cursor, query=query)
+            ids.extend(obj.id for obj in objects)
+            sizes.append(len(objects))
+            if cursor is None:
+                return ids, sizes
+
+    def test_pages_cover_every_row_once(self):
+        """Following the cursors yields every row once, in (created_at, id) order"""
+        ids, sizes = self.collect(2)
+        self.assertEqual(ids, self.expected)
+        self.assertEqual(sizes, [2, 2, 1])
+
+    def test_last_page_has_no_cursor(self):
+        """A page holding the remaining rows has no next cursor"""
+        objects, cursor = storage.page(Member, 5)
+        self.assertEqual(len(objects), 5)
+        self.assertIsNone(cursor)
+
+    def test_query_narrows_the_rows(self):
+        """The optional query filters the paged rows"""
+        ids, _ = self.collect(1, query=storage.query(Member).filter(Member.gender == 'Male'))
+        self.assertEqual(ids, [member_id for member_id in self.expected
+                               if storage.get(Member, member_id).gender == 'Male'])
+
+    def test_invalid_cursor(self):
+        """A malformed cursor raises ValueError"""
+        with self.assertRaises(ValueError):
+            storage.page(Member, 2, 'not-a-cursor')
+
+    def test_unknown_class(self):
+        """An unknown class yields an empty page"""
+        self.assertEqual(storage.page('Unknown', 2), ([], None))
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestSaveMany(unittest.TestCase):
+    """Test cases for DBStorage.save_many"""
+
+    def test_saves_every_valid_row(self):
+        """Rows are saved across several batches"""
+        members = [make_member(n) for n in range(5)]
+        result = storage.save_many(members, batch_size=2)
+        self.assertEqual(result['saved'], [member.id for member in members])
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(storage.query(Member).count(), 5)
+
+    def test_existing_value_is_refused(self):
+        """A row repeating a stored unique value is reported"""
+        storage.save_many([make_member(1)])
+        result = storage.save_many([make_member(2), make_member(3, email="member1@example.com")])
+        self.assertEqual(len(result['saved']), 1)
+        self.assertEqual([(error['index'], error['error']) for error in result['errors']],
+                         [(1, "Email already exists")])
+
+    def test_duplicate_in_batch_is_refused(self):
+        """The second of two rows sharing a unique value is reported"""
+        first, second = make_member(1), make_member(2, email="member1@example.com")
+        result = storage.save_many([first, second])
+        self.assertEqual(result['saved'], [first.id])
+        self.assertEqual([error['index'] for error in result['errors']], [1])
+
+    def test_value_of_rejected_row_stays_available(self):
+        """A row whose insert fails does not block a later row with its value"""
+        invalid = make_member(1, first_name=None)  # NOT NULL violation
+        valid = make_member(2, email="member1@example.com")
+        result = storage.save_many([invalid, make_member(3), valid])
+        self.assertEqual(len(result['saved']), 2)
+        self.assertIn(valid.id, result['saved'])
+        self.assertEqual([error['index'] for error in result['errors']], [0])
+        self.assertEqual(storage.query(Member).filter_by(email="member1@example.com").one().id, valid.id)
+
+
+class TestReplica(unittest.TestCase):
+    """Test cases for read routing between a primary and a replica, each a SQLite file"""
+
+    @pytest.fixture(autouse=True)
+    def set_up_databases(self, tmp_path, monkeypatch):
+        """Creates a storage whose replica only holds a member named Replica"""
+        self.monkeypatch = monkeypatch
+        self.primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+        self.missing_url = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+        replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+        replica = DBStorage(replica_url)
+        replica.reload()
+        replica.new(make_member(1, first_name="Replica"))
+        replica.save()
+        replica.close()
+        replica.engine.dispose()
+
+        self.storage = DBStorage(self.primary_url, replica_url)
+        self.storage.reload()
+        yield
+        self.storage.close()
+
+    def read_names(self):
+        """Returns the first names the read path sees"""
+        return [member.first_name for member in self.storage.query(Member, read_only=True)]
+
+    def test_reads_use_the_replica(self):
+        """Read-only queries are served by the replica"""
+        self.assertTrue(self.storage.has_replica)
+        self.assertEqual(self.read_names(), ["Replica"])
+        self.assertEqual(self.storage.query(Member).count(), 0)
+
+    def test_counts_come_from_the_primary(self):
+        """Row counts are seeded from the primary, where the commits adjusting them land"""
+        self.assertEqual(self.storage.count(Member), 0)
+        self.storage.new(make_member(2))
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.count(Member), 1)
+
+    def test_write_pins_reads_to_primary(self):
+        """After a write, reads hit the primary until the session is closed"""
+        self.storage.new(make_member(2, first_name="Primary"))
+        self.storage.save()
+        self.assertEqual(self.read_names(), ["Primary"])
+        self.storage.close()
+        self.assertEqual(self.read_names(), ["Replica"])
+
+    def test_pin_primary(self):
+        """pin_primary sends the reads of the thread to the primary until close()"""
+        self.storage.pin_primary()
+        self.assertEqual(self.read_names(), [])
+        self.storage.close()
+        self.assertEqual(self.read_names(), ["Replica"])
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        """When the health check fails, reads fall back to the primary"""
+        self.monkeypatch.setattr(Config, 'REPLICA_HEALTH_INTERVAL', 0)
+        down = DBStorage(self.primary_url, self.missing_url)
+        try:
+            self.assertFalse(down.replica_healthy())
+            self.assertEqual([member.first_name for member in down.query(Member, read_only=True)], [])
+        finally:
+            down.close()
+
+    def test_failed_replica_query_marks_it_down(self):
+        """A connection error on the replica sends reads to the primary until the next check"""
+        down = DBStorage(self.primary_url, self.missing_url)
+        try:
+            self.assertTrue(down.replica_healthy())  # not probed yet
+            with self.assertRaises(OperationalError):
+                down.query(Member, read_only=True).all()
+            down.close()
+            self.assertFalse(down.replica_healthy())
+            self.assertEqual(down.query(Member, read_only=True).all(), [])
+        finally:
+            down.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
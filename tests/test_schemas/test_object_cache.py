@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Unit tests for ObjectCache class"""
+import unittest
+from unittest.mock import patch
+
+from app.schemas.object_cache import ObjectCache
+
+
+class Department:
+    """Stands in for a cached model class"""
+
+
+class Member:
+    """Stands in for a model class without a TTL"""
+
+
+class TestObjectCache(unittest.TestCase):
+    """Test cases for ObjectCache class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.cache = ObjectCache(max_size=2, ttls={'Department': 60})
+
+    def test_cacheable(self):
+        """Test only classes with a TTL are cached"""
+        self.assertTrue(self.cache.cacheable(Department))
+        self.assertFalse(self.cache.cacheable(Member))
+        self.assertFalse(ObjectCache(0, {'Department': 60}).cacheable(Department))
+
+    def test_hit_and_miss(self):
+        """Test lookups count hits and misses"""
+        self.assertIsNone(self.cache.get(Department, '1'))
+        self.cache.put(Department, '1', {'id': '1'})
+        self.assertEqual(self.cache.get(Department, '1'), {'id': '1'})
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        self.cache.put(Department, '1', {'id': '1'})
+        self.cache.put(Department, '2', {'id': '2'})
+        self.cache.get(Department, '1')
+        self.cache.put(Department, '3', {'id': '3'})
+        self.assertIsNone(self.cache.get(Department, '2'))
+        self.assertIsNotNone(self.cache.get(Department, '1'))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their class TTL"""
+        self.cache.put(Department, '1', {'id': '1'})
+        with patch('app.schemas.object_cache.time.monotonic', return_value=10 ** 9):
+            self.assertIsNone(self.cache.get(Department, '1'))
+
+    def test_invalidate(self):
+        """Test invalidated entries are dropped"""
+        self.cache.put(Department, '1', {'id': '1'})
+        self.cache.invalidate(Department, '1')
+        self.assertIsNone(self.cache.get(Department, '1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""Unit tests for the compiled model serializers"""
+import unittest
+from datetime import date, datetime, time
+
+from sqlalchemy import Column, Date, DateTime, Float, String, Time
+from sqlalchemy.orm import declarative_base
+
+from app.schemas.serializers import DATETIME_FORMAT, Serializer
+
+Base = declarative_base()
+
+
+class Record(Base):
+    """Stands in for a model with every converted column type"""
+    __tablename__ = 'records'
+    id = Column(String(60), primary_key=True)
+    secret = Column(String(60))
+    amount = Column(Float)
+    day = Column(Date)
+    starts = Column(Time)
+    created_at = Column(DateTime)
+
+
+class TestSerializer(unittest.TestCase):
+    """Test cases for Serializer class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.serialize = Serializer(Record, exclude=('secret',))
+        self.record = Record(id='1', secret='x', amount=10, day=date(2024, 1, 7),
+                             starts=time(9, 30), created_at=datetime(2024, 1, 7, 9))
+
+    def test_fields_follow_the_mapper(self):
+        """Test fields are ordered like the columns and exclusions are dropped"""
+        self.assertEqual(list(self.serialize(self.record)),
+                         ['id', 'amount', 'day', 'starts', 'created_at', '__class__'])
+
+    def test_values_are_json_ready(self):
+        """Test dates, times and floats are converted"""
+        result = self.serialize(self.record)
+        self.assertEqual(result['amount'], 10.0)
+        self.assertIsInstance(result['amount'], float)
+        self.assertEqual(result['day'], '2024-01-07')
+        self.assertEqual(result['starts'], '09:30:00')
+        self.assertEqual(result['created_at'], '2024-01-07T09:00:00.000000')
+        self.assertEqual(datetime.strptime(result['created_at'], DATETIME_FORMAT), self.record.created_at)
+        self.assertEqual(result['__class__'], 'Record')
+
+    def test_none_values(self):
+        """Test missing values serialize as None"""
+        result = self.serialize(Record(id='2'))
+        self.assertIsNone(result['day'])
+        self.assertIsNone(result['created_at'])
+
+    def test_row(self):
+        """Test mappings such as result rows serialize the same way"""
+        row = {'id': '1', 'amount': 10, 'day': date(2024, 1, 7), 'starts': time(9, 30),
+               'created_at': datetime(2024, 1, 7, 9)}
+        self.assertEqual(self.serialize.row(row), self.serialize(self.record))
+
+
+if __name__ == '__main__':
+    unittest.main()
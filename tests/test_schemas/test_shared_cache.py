@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+"""Unit tests for SharedCache class"""
+import threading
+import time
+import unittest
+from datetime import date
+
+from app.schemas.shared_cache import MemoryBackend, NullBackend, SharedCache
+
+
+class Event:
+    """Stands in for a written model"""
+
+    def __init__(self, id):
+        self.id = id
+
+
+class TestSharedCache(unittest.TestCase):
+    """Test cases for SharedCache class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.cache = SharedCache(MemoryBackend(), namespace='test')
+        self.calls = 0
+
+    def produce(self):
+        """Counts calls and returns a payload"""
+        self.calls += 1
+        return {'day': date(2024, 1, 7), 'n': self.calls}
+
+    def test_hit_after_miss(self):
+        """Test the second lookup is served from the cache"""
+        first = self.cache.get_or_set('report', {'a': 1}, self.produce)
+        second = self.cache.get_or_set('report', {'a': 1}, self.produce)
+        self.assertEqual(first, {'day': '2024-01-07', 'n': 1})
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_params_are_part_of_the_key(self):
+        """Test different parameters produce different entries"""
+        self.cache.get_or_set('report', {'a': 1}, self.produce)
+        self.cache.get_or_set('report', {'a': 2}, self.produce)
+        self.assertEqual(self.calls, 2)
+
+    def test_writes_invalidate_dependents(self):
+        """Test a committed write makes dependent entries stale"""
+        self.cache.get_or_set('event', {'id': '1'}, self.produce, depends_on=['Event:1'])
+        self.cache.get_or_set('events', {}, self.produce, depends_on=['Event'])
+        self.cache.get_or_set('other', {}, self.produce, depends_on=['Event:2'])
+        self.cache.invalidate_writes([('dirty', Event('1'), {})])
+        self.cache.get_or_set('event', {'id': '1'}, self.produce, depends_on=['Event:1'])
+        self.cache.get_or_set('events', {}, self.produce, depends_on=['Event'])
+        self.cache.get_or_set('other', {}, self.produce, depends_on=['Event:2'])
+        self.assertEqual(self.calls, 5)
+
+    def test_tracked_values(self):
+        """Test writes only invalidate entries depending on the values they touch"""
+        self.cache.track(Event, 'day')
+        event = Event('1')
+        event.day = date(2024, 1, 7)
+        self.cache.get_or_set('range', {}, self.produce, depends_on=['Event.day:2024-01-07'])
+        self.cache.get_or_set('range', {'b': 1}, self.produce, depends_on=['Event.day:2024-02-01'])
+        self.cache.invalidate_writes([('dirty', event, {'day': date(2024, 1, 6)})])
+        self.cache.get_or_set('range', {}, self.produce, depends_on=['Event.day:2024-01-07'])
+        self.cache.get_or_set('range', {'b': 1}, self.produce, depends_on=['Event.day:2024-02-01'])
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(self.cache.versions(['Event.day:2024-01-06']), [1])
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL"""
+        backend = MemoryBackend()
+        backend.set('k', 'v', ex=0.01)
+        self.assertEqual(backend.get('k'), 'v')
+        time.sleep(0.02)
+        self.assertIsNone(backend.get('k'))
+
+    def test_single_flight(self):
+        """Test concurrent misses compute the value only once"""
+        def slow():
+            time.sleep(0.1)
+            return self.produce()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.cache.get_or_set('slow', {}, slow))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result == results[0] for result in results))
+
+
+class TestFromConfig(unittest.TestCase):
+    """Test cases for SharedCache.from_config without Redis"""
+
+    def config(self, env):
+        """Returns a configuration for env without REDIS_URL"""
+        return type('Config', (), {'REDIS_URL': None, 'ENV': env, 'CACHE_NAMESPACE': 'test', 'CACHE_TTL': 300})
+
+    def test_memory_in_development(self):
+        """Test dev and test keep entries in process memory"""
+        for env in ('dev', 'test'):
+            self.assertIsInstance(SharedCache.from_config(self.config(env)).backend, MemoryBackend)
+
+    def test_disabled_in_production(self):
+        """Test nothing is cached across requests without a shared backend"""
+        with self.assertLogs('app.schemas.shared_cache', 'WARNING'):
+            cache = SharedCache.from_config(self.config('production'))
+        self.assertIsInstance(cache.backend, NullBackend)
+        calls = []
+        for _ in range(2):
+            cache.get_or_set('report', {}, lambda: calls.append(1) or len(calls), depends_on=['Event'])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
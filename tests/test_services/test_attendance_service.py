@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+"""Unit tests for AttendanceService: the incremental event summaries must
+always match a rebuild from the attendance records"""
+import unittest
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from app.models import storage
+from app.models.attendance import Attendance
+from app.models.event import Event
+from app.models.member import Member
+from app.services.attendance_service import AttendanceService, SUMMARY_COUNTS
+
+START = datetime(2026, 1, 4, 9)
+
+
+def make_event(n):
+    """Returns a saved event"""
+    event = Event(name=f"Service {n}", start_date=date(2026, 1, 4), end_date=date(2026, 1, 4),
+                  start_time=time(9), end_time=time(11), location="Main Sanctuary",
+                  description="Sunday service", category="Service")
+    event.save()
+    return event
+
+
+def make_member(n):
+    """Returns a saved member"""
+    member = Member(first_name=f"First{n}", last_name="Last", email=f"member{n}@example.com",
+                    phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                    gender="Female", marital_status="Single")
+    member.save()
+    return member
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestSummaries(unittest.TestCase):
+    """Test cases for the summaries kept by create_records, update_record and delete_record"""
+
+    def setUp(self):
+        """Saves three events and two members"""
+        self.events = [make_event(n).id for n in range(3)]
+        self.members = [make_member(n).id for n in range(2)]
+        self.created = 0
+
+    def make_record(self, event, member=None, status='Present'):
+        """Returns an unsaved record, created a minute after the previous one"""
+        self.created += 1
+        return Attendance(event_id=self.events[event], status=status, date=date(2026, 1, 4),
+                          member_id=None if member is None else self.members[member],
+                          is_guest=member is None,
+                          created_at=(START + timedelta(minutes=self.created)).strftime("%Y-%m-%dT%H:%M:%S.%f"))
+
+    def record(self, event, member=None, status='Present'):
+        """Creates a record, a minute after the previous one"""
+        return AttendanceService.create_records([self.make_record(event, member, status)])[0]
+
+    def counts(self):
+        """Returns the counts of each event, zeros when it has no summary"""
+        counts = {}
+        for event_id in self.events:
+            summary = AttendanceService.summary(event_id) or {}
+            counts[event_id] = [summary.get(name, 0) for name in SUMMARY_COUNTS]
+        return counts
+
+    def assert_rebuilt(self, first_timers):
+        """Checks the first-timer counts per event, and that a rebuild finds the same summaries"""
+        storage.close()
+        incremental = self.counts()
+        self.assertEqual([incremental[event_id][-1] for event_id in self.events], first_timers)
+        AttendanceService.rebuild_summary()
+        storage.close()
+        self.assertEqual(self.counts(), incremental)
+
+    def test_create(self):
+        """Each member is a first-timer at the event of their first record"""
+        self.record(0, 0)
+        self.record(1, 0)
+        self.record(1, 1, status='Absent')
+        self.record(2)
+        self.assert_rebuilt([1, 1, 0])
+
+    def test_tied_created_at(self):
+        """Of a member's records sharing the earliest created_at, only the one with the lowest id is the first"""
+        records = [self.make_record(event, 0) for event in range(3)]
+        for record in records:
+            record.created_at = START
+        AttendanceService.create_records(records)
+        first = min(records, key=lambda record: record.id)
+        expected = [int(event_id == first.event_id) for event_id in self.events]
+        self.assert_rebuilt(expected)
+        AttendanceService.delete_record(first)
+        second = min((record for record in records if record is not first), key=lambda record: record.id)
+        self.assert_rebuilt([int(event_id == second.event_id) for event_id in self.events])
+
+    def test_move_first_record(self):
+        """Moving a member's first record to another event moves the first-timer with it"""
+        first = self.record(0, 0)
+        self.record(1, 0)
+        AttendanceService.update_record(first, {'event_id': self.events[2]})
+        self.assert_rebuilt([0, 0, 1])
+
+    def test_move_later_record(self):
+        """Moving a record that is not the member's first leaves the first-timers alone"""
+        self.record(0, 0)
+        later = self.record(1, 0)
+        AttendanceService.update_record(later, {'event_id': self.events[2]})
+        self.assert_rebuilt([1, 0, 0])
+
+    def test_reassign_to_member_with_later_records(self):
+        """A record given to a member whose first record is later becomes their first"""
+        first = self.record(0, 0)
+        self.record(1, 1)
+        AttendanceService.update_record(first, {'member_id': self.members[1]})
+        self.assert_rebuilt([1, 0, 0])
+
+    def test_reassign_later_record(self):
+        """The old member's next record becomes their first when one of theirs is reassigned"""
+        self.record(0, 1)
+        first = self.record(1, 0)
+        self.record(2, 0)
+        AttendanceService.update_record(first, {'member_id': self.members[1]})
+        self.assert_rebuilt([1, 0, 1])
+
+    def test_reassign_to_guest(self):
+        """A member record turned into a guest record takes the first-timer away"""
+        first = self.record(0, 0)
+        AttendanceService.update_record(first, {'member_id': None, 'is_guest': True})
+        self.assert_rebuilt([0, 0, 0])
+
+    def test_delete_first_record(self):
+        """Deleting a member's first record makes their next record the first"""
+        first = self.record(0, 0)
+        self.record(1, 0)
+        AttendanceService.delete_record(first)
+        self.assert_rebuilt([0, 1, 0])
+
+    def test_delete_later_record(self):
+        """Deleting a later record leaves the first-timers alone"""
+        self.record(0, 0)
+        later = self.record(1, 0)
+        self.record(1, 1)
+        AttendanceService.delete_record(later)
+        self.assert_rebuilt([1, 1, 0])
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestTrends(unittest.TestCase):
+    """Test cases for AttendanceService.build_trends"""
+
+    def test_status_ignores_case(self):
+        """Records are matched whatever the case of their status"""
+        event_id, member_id = make_event(1).id, make_member(1).id
+        AttendanceService.create_records([
+            Attendance(event_id=event_id, member_id=member_id, status=status, date=date(2026, 1, 4))
+            for status in ('Present', 'PRESENT', 'absent')])
+        storage.close()
+        trends = AttendanceService.build_trends('month', date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual(trends['overall']['counts'], [2])
+        trends = AttendanceService.build_trends('month', date(2026, 1, 1), date(2026, 1, 31), status='ABSENT')
+        self.assertEqual(trends['overall']['counts'], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
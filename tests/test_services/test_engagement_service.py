@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Unit tests for EngagementService"""
+import unittest
+from datetime import date, datetime, time
+
+import pytest
+
+from app.models import storage
+from app.models.attendance import Attendance
+from app.models.engagement_score import MemberEngagementScore
+from app.models.event import Event
+from app.models.member import Member
+from app.services.engagement_service import EngagementService
+
+AS_OF = date(2026, 1, 31)
+
+
+def make_member(n):
+    """Returns a saved member"""
+    member = Member(first_name=f"First{n}", last_name="Last", email=f"member{n}@example.com",
+                    phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                    gender="Female", marital_status="Single")
+    member.save()
+    return member
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestCompute(unittest.TestCase):
+    """Test cases for EngagementService.compute"""
+
+    def setUp(self):
+        """Saves an event and two members"""
+        event = Event(name="Service", start_date=date(2026, 1, 4), end_date=date(2026, 1, 4),
+                      start_time=time(9), end_time=time(11), location="Main Sanctuary",
+                      description="Sunday service", category="Service")
+        event.save()
+        self.event_id = event.id
+        self.members = [make_member(n).id for n in range(2)]
+
+    def attend(self, member, day, status):
+        """Saves a record of a member"""
+        Attendance(event_id=self.event_id, member_id=self.members[member], status=status, date=day).save()
+
+    def scores(self):
+        """Returns {member_id: score row}"""
+        storage.close()
+        return {score.member_id: score for score in storage.query(MemberEngagementScore)}
+
+    def test_status_ignores_case(self):
+        """Present records count whatever the case of their status; absences do not"""
+        self.attend(0, date(2026, 1, 25), 'Present')
+        self.attend(0, date(2026, 1, 18), 'PRESENT')
+        self.attend(1, date(2026, 1, 25), 'Absent')
+        self.assertEqual(EngagementService.compute(AS_OF), 2)
+        scores = self.scores()
+        self.assertEqual(scores[self.members[0]].attended_4w, 2)
+        self.assertEqual(scores[self.members[0]].last_attended, date(2026, 1, 25))
+        self.assertEqual(scores[self.members[1]].attended_4w, 0)
+        self.assertEqual((scores[self.members[0]].rank, scores[self.members[1]].rank), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""Unit tests for FinanceService: the incremental monthly summaries must
+always match a rebuild from the financial records"""
+import unittest
+from datetime import date
+
+import pytest
+
+from app.models import storage
+from app.services.finance_service import FinanceService
+
+
+def record_data(**kwargs):
+    """Returns the fields of an offering record"""
+    data = dict(type="Income", amount=100.0, description="Sunday offering", category="offering")
+    data.update(kwargs)
+    return data
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestSummaries(unittest.TestCase):
+    """Test cases for the summaries kept by create_record, update_record and delete_record"""
+
+    def assert_rebuilt(self, expected):
+        """Checks the (period, category, total, count) rows, and that a rebuild finds the same summaries"""
+        storage.close()
+        incremental = FinanceService.summary()
+        self.assertEqual([(row['period'], row['category'], row['total'], row['count']) for row in incremental],
+                         expected)
+        FinanceService.rebuild_summary()
+        storage.close()
+        self.assertEqual(FinanceService.summary(), incremental)
+
+    def test_create(self):
+        """Records of the same month and category share a summary row"""
+        period = date.today().strftime("%Y-%m")
+        FinanceService.create_record(record_data())
+        FinanceService.create_record(record_data(amount=50.5))
+        FinanceService.create_record(record_data(category="tithe", amount=20.0))
+        self.assert_rebuilt([(period, "offering", 150.5, 2), (period, "tithe", 20.0, 1)])
+
+    def test_update(self):
+        """An update moves the amount between rows when the category or month changes"""
+        period = date.today().strftime("%Y-%m")
+        first = FinanceService.create_record(record_data())
+        second = FinanceService.create_record(record_data(amount=40.0))
+        FinanceService.update_record(first, {'amount': 60.0})
+        FinanceService.update_record(second, {'category': "tithe", 'date': "2025-12-07"})
+        self.assert_rebuilt([("2025-12", "tithe", 40.0, 1), (period, "offering", 60.0, 1)])
+
+    def test_delete(self):
+        """Deleting the last record of a row removes the row"""
+        period = date.today().strftime("%Y-%m")
+        FinanceService.create_record(record_data())
+        tithe = FinanceService.create_record(record_data(category="tithe"))
+        FinanceService.delete_record(tithe)
+        self.assert_rebuilt([(period, "offering", 100.0, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""Unit tests for ParticipationReportService"""
+import unittest
+from datetime import date, datetime, time
+
+import pytest
+
+from app.models import storage
+from app.models.attendance import Attendance
+from app.models.event import Event
+from app.models.member import Member
+from app.services.participation_report_service import ParticipationReportService
+
+
+@pytest.mark.usefixtures('clean_storage')
+class TestBuild(unittest.TestCase):
+    """Test cases for ParticipationReportService.build"""
+
+    def setUp(self):
+        """Saves an event and two members, one of whom attended"""
+        event = Event(name="Service", start_date=date(2026, 1, 4), end_date=date(2026, 1, 4),
+                      start_time=time(9), end_time=time(11), location="Main Sanctuary",
+                      description="Sunday service", category="Service")
+        event.save()
+        members = []
+        for n, gender in enumerate(['Female', 'Male']):
+            member = Member(first_name=f"First{n}", last_name="Last", email=f"member{n}@example.com",
+                            phone_number="0244000000", address="Accra", date_of_birth=datetime(1990, 1, 1),
+                            gender=gender, marital_status="Single")
+            member.save()
+            members.append(member.id)
+        for day, status in ((date(2026, 1, 4), 'Present'), (date(2026, 1, 11), 'PRESENT'),
+                            (date(2026, 1, 18), 'absent')):
+            Attendance(event_id=event.id, member_id=members[0], status=status, date=day).save()
+        storage.close()
+
+    def test_counts(self):
+        """Present records count whatever the case of their status"""
+        report = ParticipationReportService.build(date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual(report['totals'], {'members': 2, 'attending_members': 1, 'records': 3, 'present': 2,
+                                            'participation_rate': 0.5})
+        by_gender = {entry['value']: entry for entry in report['by']['gender']}
+        self.assertEqual((by_gender['Female']['present'], by_gender['Male']['records']), (2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
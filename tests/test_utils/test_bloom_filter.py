@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+"""Unit tests for BloomFilter class"""
+import unittest
+
+from app.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test cases for BloomFilter class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            self.bloom.add(f"user{i}@example.com")
+
+    def test_no_false_negatives(self):
+        """Test every added item is reported present"""
+        self.assertTrue(all(f"user{i}@example.com" in self.bloom for i in range(1000)))
+        self.assertEqual(self.bloom.count, 1000)
+
+    def test_false_positive_rate(self):
+        """Test absent items are rarely reported present"""
+        false_positives = sum(f"other{i}@example.com" in self.bloom for i in range(10000))
+        self.assertLess(false_positives / 10000, 0.03)
+
+    def test_empty(self):
+        """Test an empty filter contains nothing"""
+        self.assertNotIn("anything", BloomFilter(10))
+
+
+if __name__ == '__main__':
+    unittest.main()
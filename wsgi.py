@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""Main Flask application entry point
+
+The module is not named app.py because the app/ package would shadow it:
+run the CLI with `flask --app wsgi <command>` and serve `wsgi:create_app()`.
+"""
+from flask import Flask, jsonify, request
+from flask_sqlalchemy import SQLAlchemy
+from flask_jwt_extended import JWTManager
+from flask_marshmallow import Marshmallow
+from config import Config
+from app.models.base_model import Base
+
+
+class StorageSQLAlchemy(SQLAlchemy):
+    """Flask-SQLAlchemy extension that reuses the engine and session registry
+    of `app.models.storage` instead of opening a second connection pool"""
+
+    def _make_engine(self, bind_key, options, app):
+        """Returns the storage engine"""
+        from app.models import storage
+        return storage.engine
+
+    def _make_scoped_session(self, options):
+        """Returns the storage scoped_session registry"""
+        from app.models import storage
+        return storage.session
+
+
+# Initialize extensions
+db = StorageSQLAlchemy(metadata=Base.metadata)
+ma = Marshmallow()
+jwt = JWTManager()
+
+def create_app():
+    """Creates and configures the Flask application"""
+    app = Flask(__name__)
+
+    app.config.from_object(Config)
+
+    # Initialize extensions
+    db.init_app(app)
+    ma.init_app(app)
+    jwt.init_app(app)
+
+    app.url_map.strict_slashes = False
+    # Register blueprints
+    from app.routes.auth import auth_bp
+    from app.routes.admin import admin_bp
+    from app.routes.department import department_bp
+    from app.routes.group import group_bp
+    from app.routes.member import members_bp
+    from app.routes.event import events_bp
+    from app.routes.attendance import attendance_bp
+    from app.routes.finance import finance_bp
+    from app.routes.stats import stats_bp
+
+    app.register_blueprint(auth_bp, url_prefix="/auth")
+    app.register_blueprint(admin_bp, url_prefix="/admin")
+    app.register_blueprint(department_bp, url_prefix="/resources")
+    app.register_blueprint(members_bp, url_prefix="/resources")
+    app.register_blueprint(group_bp, url_prefix="/resources")
+    app.register_blueprint(events_bp, url_prefix="/resources")
+    app.register_blueprint(attendance_bp, url_prefix="/resources")
+    app.register_blueprint(finance_bp, url_prefix="/resources")
+    app.register_blueprint(stats_bp, url_prefix="/resources")
+
+    # Register maintenance commands
+    from app.commands import commands
+    for command in commands:
+        app.cli.add_command(command)
+
+
+
+    # Scope the storage session to each request/app context
+    from app.models import storage
+
+    @app.before_request
+    def route_reads():
+        """Pins requests that write, or that ask to read their own writes, to the primary"""
+        if request.method not in ['GET', 'HEAD', 'OPTIONS'] or \
+                request.headers.get('X-Read-Your-Writes', '').lower() == 'true':
+            storage.pin_primary()
+
+    @app.teardown_appcontext
+    def close_session(exception=None):
+        """Removes the session so its connection goes back to the pool"""
+        storage.close()
+
+    # Handle 404 errors
+    @app.errorhandler(404)
+    def not_found(error):
+        return jsonify({"error": "Not found"}), 404
+
+    # Handle other errors
+    @app.errorhandler(500)
+    def internal_server_error(error):
+        return jsonify({"error": "Internal server error"}), 500
+
+    @app.route("/")
+    def home():
+        return jsonify({"message": "Welcome to FaithConnectHub! API"}), 200
+
+    # Warm the process caches in the background; the load balancer polls /ready
+    from app.utils.warmup_helper import Warmup
+    warmup = app.extensions['warmup'] = Warmup(app)
+    if app.config['WARMUP_ENABLED']:
+        warmup.start()
+    else:
+        warmup.done.set()
+
+    @app.route("/ready")
+    def ready():
+        """Readiness probe: 200 once the warm-up is over, 503 before"""
+        return jsonify(warmup.status()), 200 if warmup.ready else 503
+    return app
+
+
+if __name__ == "__main__":
+    # Tables are created by storage.reload() when app.models is first imported
+    app = create_app()
+    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file